@@ -1,5 +1,6 @@
 """pydantic models for generic endpoint responses"""
 
+import uuid
 from typing import Generic, TypeVar
 from typing_extensions import Annotated
 from pydantic import BaseModel, Field
@@ -37,3 +38,9 @@ class SingleItemResponse(BaseModel, Generic[DataResponse]):
     """simple wrapper around generic single item response"""
 
     data: DataResponse | None
+
+
+class IdsResponse(BaseModel):
+    """response with only the ids of the affected records (e.g. for echo=false)"""
+
+    ids: list[uuid.UUID]
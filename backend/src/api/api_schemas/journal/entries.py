@@ -36,6 +36,12 @@ class EntryCreateSchema(BaseModel):
     raw_markdown: Optional[str] = None
 
 
+class EncryptedCreateSchema(EntryCreateSchema):
+    """Schema for creating entries with encrypted markdown (internal use only)"""
+
+    encrypted_markdown: Optional[str] = None
+
+
 class EntryCreateWithDateSchema(BaseModel):
     """Schema for creating a new entry with date and user_id (will upsert thread)"""
 
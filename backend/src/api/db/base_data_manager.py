@@ -4,9 +4,9 @@ Base data manager for all models.
 
 import uuid
 from api.db.database import DBSessionDep
-from sqlalchemy import ColumnElement, func, select, Table, delete
+from sqlalchemy import ColumnElement, func, inspect, insert, select, Table, delete
 import datetime as dt
-from typing import Any, Iterable, Sequence, TypeVar, Generic, cast
+from typing import Any, Iterable, Literal, Sequence, TypeVar, Generic, cast, overload
 from pydantic import BaseModel
 from sqlalchemy import or_, and_
 from sqlalchemy.orm import DeclarativeBase
@@ -54,6 +54,8 @@ class DataValidationError(Exception):
 # db model type when getting specific implementation of base data manager (eg. ThreadsModel)
 TModel = TypeVar("TModel", bound=DeclarativeBase)
 
+_SORT_DIRECTIONS = frozenset(("asc", "desc"))
+
 
 class SessionMixin:
     """Provides instance of db session."""
@@ -91,9 +93,9 @@ class BaseDataManager(Generic[TModel], SessionMixin):
             )
 
         dir_lower = direction.lower()
-        if dir_lower not in {"asc", "desc"}:
+        if dir_lower not in _SORT_DIRECTIONS:
             raise DataValidationError(
-                "sort_direction must be 'asc' or 'desc', but got '{direction}'",
+                f"sort_direction must be 'asc' or 'desc', but got '{direction}'",
             )
 
         stmt = stmt.order_by(sort_col.desc() if dir_lower == "desc" else sort_col)
@@ -217,16 +219,18 @@ class BaseDataManager(Generic[TModel], SessionMixin):
         self,
         upsert_rows: Sequence[dict[str, Any]],
         unique_constr_cols: Iterable[str],
-    ) -> list[TModel]:
+        ids_only: bool = False,
+    ) -> list[Any]:
         """find & return the rows we upserted.
         - doing this via unique constraint cols is more reliable than trying to parse the RETURNING clause results
 
         Args:
             upsert_rows (Sequence[dict[str, Any]]): the rows requested to be upserted
             conflict_columns (Iterable[str]): the cols that uniquely identify a row (hence used to check for existing rows)
+            ids_only (bool, optional): select just the id col rather than full models. Defaults to False.
 
         Returns:
-            list[TModel]: the rows that were upserted
+            list[Any]: the rows (or their ids) that were upserted
         """
 
         # first get the relevant filters for each row
@@ -247,7 +251,9 @@ class BaseDataManager(Generic[TModel], SessionMixin):
             return []
 
         # use OR to combine different rows
-        query = select(self.model).where(or_(*conflict_filters))
+        query = select(table.c.id if ids_only else self.model).where(
+            or_(*conflict_filters)
+        )
         existing_objs = await self.session.scalars(query)
         return list(existing_objs.all())
 
@@ -290,7 +296,7 @@ class BaseDataManager(Generic[TModel], SessionMixin):
 
     async def get_page(
         self, select_stmt: Select, page_params: PageParams
-    ) -> list[TModel]:
+    ) -> list[Any]:
         """given select stmt and page params with current page & page size, return models for page"""
 
         select_stmt_paged = select_stmt.limit(page_params.page_size).offset(
@@ -304,8 +310,12 @@ class BaseDataManager(Generic[TModel], SessionMixin):
         ids: Sequence[uuid.UUID] | None,
         page_params: PageParams,
         sort_params: SortParams,
-    ) -> tuple[list[TModel], int]:
-        stmt = select(self.model)
+        column: Any | None = None,
+    ) -> tuple[list[Any], int]:
+        """
+        - column selects just that col's values (skipping ORM hydration), rather than models
+        """
+        stmt = select(column) if column is not None else select(self.model)
 
         if ids:
             stmt = stmt.where(self._get_id_column().in_(ids))
@@ -321,9 +331,42 @@ class BaseDataManager(Generic[TModel], SessionMixin):
     # CREATEs
     # #########################################################################################
 
-    async def add_rows(self, models: Sequence[TModel]) -> Sequence[TModel]:
+    @overload
+    async def add_rows(
+        self, models: Sequence[TModel], *, ids_only: Literal[False] = ...
+    ) -> Sequence[TModel]: ...
+
+    @overload
+    async def add_rows(
+        self, models: Sequence[TModel], *, ids_only: Literal[True]
+    ) -> list[uuid.UUID]: ...
 
+    async def add_rows(
+        self, models: Sequence[TModel], *, ids_only: bool = False
+    ) -> Sequence[TModel] | list[uuid.UUID]:
+        """
+        - ids_only inserts the models' values with INSERT ... RETURNING id, rather than
+          adding + flushing the models, so no ORM models are loaded back
+        """
         try:
+            if ids_only:
+                if not models:
+                    return []
+                # only the values set on each model, so col defaults still apply
+                rows = [
+                    {
+                        attr.key: state.dict[attr.key]
+                        for attr in state.mapper.column_attrs
+                        if attr.key in state.dict
+                    }
+                    for state in map(inspect, models)
+                ]
+                stmt = insert(self.model).returning(
+                    getattr(self.model, "id"), sort_by_parameter_order=True
+                )
+                ids = await self.session.scalars(stmt, rows)
+                return list(ids.all())
+
             self.session.add_all(models)
             await self.session.flush()
             return list(models)
@@ -504,13 +547,34 @@ class BaseDataManager(Generic[TModel], SessionMixin):
     # UPSERTs
     # #########################################################################################
 
+    @overload
+    async def upsert_rows(
+        self,
+        upsert_rows: Sequence[dict[str, Any]],
+        *,
+        unique_constr_cols: Iterable[str],
+        blocked_update_fields: Iterable[str] = ...,
+        ids_only: Literal[False] = ...,
+    ) -> list[TModel]: ...
+
+    @overload
+    async def upsert_rows(
+        self,
+        upsert_rows: Sequence[dict[str, Any]],
+        *,
+        unique_constr_cols: Iterable[str],
+        blocked_update_fields: Iterable[str] = ...,
+        ids_only: Literal[True],
+    ) -> list[uuid.UUID]: ...
+
     async def upsert_rows(
         self,
         upsert_rows: Sequence[dict[str, Any]],
         *,
         unique_constr_cols: Iterable[str],
         blocked_update_fields: Iterable[str] = ("id", "created_at"),
-    ) -> list[TModel]:
+        ids_only: bool = False,
+    ) -> list[TModel] | list[uuid.UUID]:
         """upsert using pg ON CONFLICT
         - following: https://www.postgresql.org/docs/current/sql-insert.html
         - useful for upserting without having to first work out what does/doesn't exist
@@ -547,9 +611,10 @@ class BaseDataManager(Generic[TModel], SessionMixin):
             upsert_rows (Sequence[dict[str, Any]]): keys matching model columns, expected to be validated before calling func
             conflict_columns (Iterable[str]): the cols that uniquely identify a row (hence used to check for existing rows)
             blocked_update_fields (Iterable[str], optional): _description_. Defaults to ("id", "created_at").
+            ids_only (bool, optional): return only the ids of upserted rows, skipping ORM model loading. Defaults to False.
 
         Returns:
-            list[TModel]: list of models that were upserted
+            list[TModel] | list[uuid.UUID]: list of models (or ids, if ids_only) that were upserted
         """
         if not upsert_rows:
             log.info("No rows provided for upsert")
@@ -606,7 +671,7 @@ class BaseDataManager(Generic[TModel], SessionMixin):
             # easier to query for the models using unique constraint cols to ensure we get proper ORM instances
             # found this more reliable / straightforward than trying to parse the RETURNING clause results
             objs = await self._get_upserted_rows_by_conflict_cols(
-                upsert_rows, unique_constr_cols
+                upsert_rows, unique_constr_cols, ids_only=ids_only
             )
 
             return objs
@@ -648,17 +713,15 @@ class BaseDataManager(Generic[TModel], SessionMixin):
     # DELETEs
     # #########################################################################################
 
-    async def delete_rows(self, models: Sequence[TModel]) -> None:
+    async def delete_rows_by_ids(self, ids: Sequence[uuid.UUID]) -> None:
         """
-        delete multiple models using bulk delete operation.
+        delete multiple rows by pk using bulk delete operation.
         """
-        if not models:
+        if not ids:
             return
 
         try:
-            pks = [getattr(model, "id") for model in models]
-
-            stmt = delete(self.model).where(self._get_id_column().in_(pks))
+            stmt = delete(self.model).where(self._get_id_column().in_(ids))
             await self.session.execute(stmt)
             await self.session.flush()
         except Exception as e:
@@ -4,10 +4,17 @@ Data manager for journal entries with date-based queries.
 
 import datetime as dt
 import uuid
-from sqlalchemy import select
-from api.db.base_data_manager import BaseDataManager
+from sqlalchemy import delete, insert, literal, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from api.db.base_data_manager import (
+    BaseDataManager,
+    DataValidationError,
+    _is_foreign_key_violation,
+)
 from api.db.models.journal.entries import EntriesModel
 from api.db.models.journal.threads import ThreadsModel
+from api.utils.logger import log
 
 
 class EntriesDataManager(BaseDataManager[EntriesModel]):
@@ -30,26 +37,6 @@ class EntriesDataManager(BaseDataManager[EntriesModel]):
         result = await self.session.execute(stmt)
         return [(row[0], row[1]) for row in result.all()]
 
-    async def get_entry_with_thread(self, entry_id: uuid.UUID) -> EntriesModel | None:
-        """
-        find an entry with its associated thread.
-        """
-        stmt = select(EntriesModel).where(EntriesModel.id == entry_id)
-        result = await self.session.scalar(stmt)
-        return result
-
-    async def count_entries_in_thread(self, thread_id: uuid.UUID) -> int:
-        """
-        count the number of entries in a thread.
-        """
-        from sqlalchemy import func
-
-        stmt = select(func.count(EntriesModel.id)).where(
-            EntriesModel.thread_id == thread_id
-        )
-        count = await self.session.scalar(stmt)
-        return count or 0
-
     async def get_dates_with_entries(
         self, user_id: uuid.UUID, start_date: dt.date, end_date: dt.date
     ) -> set[dt.date]:
@@ -67,3 +54,150 @@ class EntriesDataManager(BaseDataManager[EntriesModel]):
 
         result = await self.session.scalars(stmt)
         return set(result.all())
+
+    async def create_entry_with_thread(
+        self,
+        user_id: uuid.UUID,
+        date: dt.date,
+        encrypted_markdown: str | None,
+        current_time: dt.datetime,
+    ) -> EntriesModel:
+        """
+        upsert the (user_id, date) thread and insert an entry into it in a single round-trip.
+
+        produces sql of the form::
+            ```sql
+            WITH upserted_thread AS (
+                INSERT INTO journal.threads (user_id, date, created_at, updated_at)
+                VALUES (:user_id, :date, :now, :now)
+                ON CONFLICT (user_id, date) DO UPDATE SET updated_at = EXCLUDED.updated_at
+                RETURNING journal.threads.id
+            )
+            INSERT INTO journal.entries (id, thread_id, encrypted_markdown, written_at, created_at, updated_at)
+            SELECT :entry_id, upserted_thread.id, :encrypted_markdown, :now, :now, :now
+            FROM upserted_thread
+            RETURNING journal.entries.*
+            ```
+        - DO UPDATE (rather than DO NOTHING) so RETURNING yields the id of an existing thread too
+        """
+        thread_insert = pg_insert(ThreadsModel).values(
+            user_id=user_id,
+            date=date,
+            created_at=current_time,
+            updated_at=current_time,
+        )
+        upserted_thread = (
+            thread_insert.on_conflict_do_update(
+                index_elements=[ThreadsModel.user_id, ThreadsModel.date],
+                set_={"updated_at": thread_insert.excluded.updated_at},
+            )
+            .returning(ThreadsModel.id)
+            .cte("upserted_thread")
+        )
+
+        entry_cols = EntriesModel.__table__.c
+        stmt = (
+            insert(EntriesModel)
+            .from_select(
+                [
+                    "id",
+                    "thread_id",
+                    "encrypted_markdown",
+                    "written_at",
+                    "created_at",
+                    "updated_at",
+                ],
+                select(
+                    literal(uuid.uuid4(), entry_cols.id.type),
+                    upserted_thread.c.id,
+                    literal(encrypted_markdown, entry_cols.encrypted_markdown.type),
+                    literal(current_time, entry_cols.written_at.type),
+                    literal(current_time, entry_cols.created_at.type),
+                    literal(current_time, entry_cols.updated_at.type),
+                ),
+            )
+            .returning(EntriesModel)
+        )
+
+        try:
+            entry = await self.session.scalar(stmt)
+        except IntegrityError as e:
+            await self.session.rollback()
+            log.exception("Integrity error while creating entry with thread")
+            if _is_foreign_key_violation(e):
+                raise DataValidationError(
+                    f"Referenced record not found while creating entry with thread: {e}",
+                    code=404,
+                ) from e
+            raise DataValidationError(
+                f"Integrity error while creating entry with thread: {e}",
+                code=409,
+            ) from e
+
+        if entry is None:
+            raise DataValidationError("Failed to create entry with thread", code=500)
+        return entry
+
+    async def delete_entry_and_maybe_thread(self, entry_id: uuid.UUID) -> bool:
+        """
+        delete an entry, and its thread if no other entries remain, in a single round-trip.
+
+        produces sql of the form::
+            ```sql
+            WITH deleted_entry AS (
+                DELETE FROM journal.entries WHERE id = :entry_id RETURNING thread_id
+            ),
+            deleted_thread AS (
+                DELETE FROM journal.threads
+                WHERE id IN (SELECT thread_id FROM deleted_entry)
+                AND NOT EXISTS (
+                    -- all CTEs see the same snapshot, so exclude the entry being deleted
+                    SELECT id FROM journal.entries
+                    WHERE thread_id = journal.threads.id AND id != :entry_id
+                )
+                RETURNING id
+            )
+            SELECT deleted_entry.thread_id, deleted_thread.id
+            FROM deleted_entry LEFT OUTER JOIN deleted_thread ON true
+            ```
+
+        Returns:
+            bool: False if no entry exists for entry_id
+        """
+        entries_tbl = EntriesModel.__table__
+        threads_tbl = ThreadsModel.__table__
+
+        deleted_entry = (
+            delete(entries_tbl)
+            .where(entries_tbl.c.id == entry_id)
+            .returning(entries_tbl.c.thread_id)
+            .cte("deleted_entry")
+        )
+        sibling_entries = select(entries_tbl.c.id).where(
+            entries_tbl.c.thread_id == threads_tbl.c.id,
+            entries_tbl.c.id != entry_id,
+        )
+        deleted_thread = (
+            delete(threads_tbl)
+            .where(threads_tbl.c.id.in_(select(deleted_entry.c.thread_id)))
+            .where(~sibling_entries.exists())
+            .returning(threads_tbl.c.id)
+            .cte("deleted_thread")
+        )
+        stmt = select(deleted_entry.c.thread_id, deleted_thread.c.id).select_from(
+            deleted_entry.outerjoin(deleted_thread, true())
+        )
+
+        try:
+            result = await self.session.execute(stmt)
+            row = result.first()
+        except IntegrityError as e:
+            # e.g. thread still referenced by a metric
+            await self.session.rollback()
+            log.error(f"Error deleting entry with thread cleanup, rolling back: {e}")
+            raise DataValidationError(
+                f"Failed to delete records: {e}",
+                code=409,
+            ) from e
+
+        return row is not None
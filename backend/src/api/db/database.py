@@ -89,4 +89,8 @@ async def get_db_session():
         yield session
 
 
-DBSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+# scope="function": the session is committed when the endpoint returns, before the response is
+# sent (the default, scope="request", commits after)
+# - so a 2xx is only sent once its writes are committed, and an immediate follow-up request sees them
+# - a failed commit becomes a 500, rather than the client already having a 2xx for lost work
+DBSessionDep = Annotated[AsyncSession, Depends(get_db_session, scope="function")]
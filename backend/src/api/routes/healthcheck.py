@@ -1,4 +1,4 @@
-from fastapi import APIRouter, status, HTTPException
+from fastapi import APIRouter, Response, status, HTTPException
 from sqlalchemy import text
 from api.db.database import sessionmanager
 
@@ -6,10 +6,11 @@ router = APIRouter()
 
 
 @router.get("/health", tags=["Healthcheck"])
-async def healthcheck():
+async def healthcheck(response: Response):
     """
     health check endpoint.
     returns service status and database connectivity.
+    - db state also in the X-DB header, so pollers can check it without parsing the body
 
     Returns:
         - 200 OK: Service and database are healthy
@@ -32,7 +33,10 @@ async def healthcheck():
         health_status["database_error"] = str(e)
         health_status["status"] = "unhealthy"
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=health_status
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=health_status,
+            headers={"X-DB": "disconnected"},
         )
 
+    response.headers["X-DB"] = "connected"
     return health_status
@@ -1,6 +1,7 @@
 import contextlib
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.gzip import GZipMiddleware
 from api import CORS_ORIGINS
 from api.db.database import sessionmanager
@@ -31,6 +32,8 @@ app = FastAPI(
     swagger_ui_parameters={"defaultModelsExpandDepth": -1},
     openapi_tags=tags_metadata,
     lifespan=lifespan,
+    # orjson natively encodes UUIDs/datetimes, noticeably faster on list responses
+    default_response_class=ORJSONResponse,
 )
 
 # ensure sec before other middleware
@@ -1,6 +1,5 @@
 import uuid
 import datetime as dt
-from sqlalchemy import select
 from api.api_schemas.journal.entries import (
     CalendarEntrySchema,
     EntryCreateSchema,
@@ -17,11 +16,10 @@ from api.api_schemas.generic import (
 )
 from api.db.base_data_manager import DataValidationError
 from api.db.database import DBSessionDep
-from api.db.models.journal.threads import ThreadsModel
 from api.middleware.auth import CurrentUser
 from api.routes.route_prefix import ENTRIES_URL
 from api.routes.route_types import OptionalUUIDList, RequiredUUIDList
-from api.services.journal.entries import DecryptedEntryModel, EntriesService
+from api.services.journal.entries import DecryptedEntry, EntriesService
 from api.utils.utils import (
     create_paged_response,
     create_response,
@@ -139,7 +137,7 @@ async def get_entries_by_date(
 
         entries_with_date = []
         for entry_tuple in entries_with_threads:
-            entry: DecryptedEntryModel = entry_tuple[0]
+            entry: DecryptedEntry = entry_tuple[0]
             thread = entry_tuple[1]
             entries_with_date.append(
                 EntryWithDateSchema(
@@ -173,27 +171,19 @@ async def create_entry_with_thread(
     validate_user_id_authorization(entry_data.user_id, current_user)
     try:
         service = EntriesService(session)
-        entry: DecryptedEntryModel = await service.create_entry_with_thread(
+        entry: DecryptedEntry = await service.create_entry_with_thread(
             user_id=entry_data.user_id,
             date=entry_data.date,
             raw_markdown=entry_data.raw_markdown,
         )
 
-        stmt = select(ThreadsModel).where(ThreadsModel.id == entry.thread_id)
-        thread = await session.scalar(stmt)
-
-        if not thread:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Thread not found after entry creation",
-            )
-
+        # the entry's thread was upserted on (user_id, date), so its date is the requested one
         return create_response(
             EntryWithDateSchema(
                 id=entry.id,
                 thread_id=entry.thread_id,
                 raw_markdown=entry.raw_markdown,
-                date=thread.date,
+                date=entry_data.date,
                 written_at=entry.written_at,
                 created_at=entry.created_at,
                 updated_at=entry.updated_at,
@@ -5,6 +5,7 @@ from api.api_schemas.journal.threads import (
     ThreadUpsertSchema,
 )
 from api.api_schemas.generic import (
+    IdsResponse,
     PageParams,
     PaginatedResponse,
     SingleItemResponse,
@@ -17,13 +18,14 @@ from api.routes.route_prefix import THREADS_URL
 from api.routes.route_types import OptionalUUIDList, RequiredUUIDList
 from api.services.journal.threads import ThreadsService
 from api.utils.utils import (
+    create_ids_response,
     create_paged_response,
     create_response,
     validate_page_params,
     validate_sort_params,
     validate_user_ids_authorization,
 )
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 router = APIRouter(prefix="/" + THREADS_URL)
 
@@ -51,15 +53,21 @@ async def get_data(
         )
 
 
-@router.post("", response_model=SingleItemResponse[list[ThreadSchema]])
+@router.post(
+    "", response_model=SingleItemResponse[list[ThreadSchema]] | IdsResponse
+)
 async def create_data(
     threads: list[ThreadCreateSchema],
     session: DBSessionDep,
     current_user: CurrentUser,
-) -> SingleItemResponse[list[ThreadSchema]]:
+    echo: bool = Query(True, description="Return created threads, else only ids"),
+) -> SingleItemResponse[list[ThreadSchema]] | IdsResponse:
     """create"""
-    validate_user_ids_authorization([t.user_id for t in threads], current_user)
+    validate_user_ids_authorization((t.user_id for t in threads), current_user)
     try:
+        if not echo:
+            ids = await ThreadsService(session).create_ids(schemas=threads)
+            return create_ids_response(ids)
         data = await ThreadsService(session).create(schemas=threads)
         return create_response(data)
     except DataValidationError as e:
@@ -77,9 +85,9 @@ async def update_data(
 ) -> SingleItemResponse[list[ThreadSchema]]:
     """update"""
     # Validate user_id if provided (it's optional in PatchSchema)
-    user_ids = [t.user_id for t in threads if t.user_id is not None]
-    if user_ids:
-        validate_user_ids_authorization(user_ids, current_user)
+    validate_user_ids_authorization(
+        (t.user_id for t in threads if t.user_id is not None), current_user
+    )
     try:
         data = await ThreadsService(session).patch(schemas=threads)
         return create_response(data)
@@ -95,15 +103,25 @@ async def update_data(
         )
 
 
-@router.post("/upsert", response_model=SingleItemResponse[list[ThreadSchema]])
+@router.post(
+    "/upsert", response_model=SingleItemResponse[list[ThreadSchema]] | IdsResponse
+)
 async def upsert_data(
     threads: list[ThreadUpsertSchema],
     session: DBSessionDep,
     current_user: CurrentUser,
-) -> SingleItemResponse[list[ThreadSchema]]:
+    echo: bool = Query(True, description="Return upserted threads, else only ids"),
+) -> SingleItemResponse[list[ThreadSchema]] | IdsResponse:
     """upsert"""
-    validate_user_ids_authorization([t.user_id for t in threads], current_user)
+    validate_user_ids_authorization((t.user_id for t in threads), current_user)
     try:
+        if not echo:
+            ids = await ThreadsService(session).upsert_ids(
+                schemas=threads,
+                unique_constr_cols=("user_id", "date"),
+                blocked_update_fields=["id", "created_at"],
+            )
+            return create_ids_response(ids)
         data = await ThreadsService(session).upsert(
             schemas=threads,
             unique_constr_cols=("user_id", "date"),
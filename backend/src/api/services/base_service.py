@@ -48,6 +48,8 @@ class BaseService(
         self.create_schema = create_schema
         self.patch_schema = patch_schema
         self.populate_create_model = to_create_model
+        # one data manager per service (i.e. per request) rather than one per method call
+        self._dm: DMType = data_manager(session, model)
 
     def _check_for_missing_ids(
         self,
@@ -66,16 +68,14 @@ class BaseService(
         self,
         id: uuid.UUID,
     ) -> TModel | None:
-        data_manager_inst = self.data_manager(self.session, self.model)
-        return await data_manager_inst.get_one_or_none_by_id(id)
+        return await self._dm.get_one_or_none_by_id(id)
 
     async def get_one_or_none(
         self,
         column_name: str,
         value: Any,
     ) -> TModel | None:
-        data_manager_inst = self.data_manager(self.session, self.model)
-        return await data_manager_inst.get_one_or_none_generic(column_name, value)
+        return await self._dm.get_one_or_none_generic(column_name, value)
 
     async def get_all_paginated(
         self,
@@ -83,8 +83,7 @@ class BaseService(
         page_params: PageParams,
         sort_params: SortParams,
     ) -> tuple[list[TModel], int]:
-        data_manager_inst = self.data_manager(self.session, self.model)
-        return await data_manager_inst.get_all_paginated(
+        return await self._dm.get_all_paginated(
             ids=ids,
             page_params=page_params,
             sort_params=sort_params,
@@ -99,10 +98,22 @@ class BaseService(
         models = [
             self.populate_create_model(schema, current_time) for schema in schemas
         ]
-        data_manager_inst = self.data_manager(self.session, self.model)
-        result = await data_manager_inst.add_rows(models)
+        result = await self._dm.add_rows(models)
         return list(result)
 
+    async def create_ids(
+        self,
+        schemas: list[CreateSchemaType],
+    ) -> list[uuid.UUID]:
+        """
+        as create, but only returns ids of the created records (no ORM models loaded).
+        """
+        current_time = get_utc_now()
+        models = [
+            self.populate_create_model(schema, current_time) for schema in schemas
+        ]
+        return await self._dm.add_rows(models, ids_only=True)
+
     async def patch(
         self,
         schemas: list[PatchSchemaType],
@@ -117,13 +128,30 @@ class BaseService(
             )
 
         row_updates = list(zip(ids, schemas))
-        data_manager_inst = self.data_manager(self.session, self.model)
-        updated_models = await data_manager_inst.patch_many_by_ids(
+        updated_models = await self._dm.patch_many_by_ids(
             row_updates, current_time=current_time
         )
 
         return updated_models
 
+    def _to_upsert_dicts(self, schemas: list[UpsertSchemaType]) -> list[dict[str, Any]]:
+        """
+        validate upsert schemas and dump them to dicts ready for the data manager.
+        """
+        # Explicitly validate that no schemas contain an 'id' field
+        if any(
+            hasattr(schema, "id") and getattr(schema, "id", None) is not None
+            for schema in schemas
+        ):
+            raise DataValidationError(
+                "Upsert operations cannot include an 'id' field. "
+                "If you know the ID, use PATCH instead. "
+                "Upsert is only for cases where you don't know if a record already exists.",
+                code=422,
+            )
+
+        return [schema.model_dump() for schema in schemas]
+
     async def upsert(
         self,
         schemas: list[UpsertSchemaType],
@@ -140,47 +168,48 @@ class BaseService(
             log.warning("No schemas provided for upsert")
             return []
 
-        # Explicitly validate that no schemas contain an 'id' field
-        if any(
-            hasattr(schema, "id") and getattr(schema, "id", None) is not None
-            for schema in schemas
-        ):
-            raise DataValidationError(
-                "Upsert operations cannot include an 'id' field. "
-                "If you know the ID, use PATCH instead. "
-                "Upsert is only for cases where you don't know if a record already exists.",
-                code=422,
-            )
-
-        data_manager_inst = self.data_manager(self.session, self.model)
-
-        upsert_dicts = [schema.model_dump() for schema in schemas]
+        upsert_dicts = self._to_upsert_dicts(schemas)
+        return await self._dm.upsert_rows(
+            upsert_dicts,
+            unique_constr_cols=unique_constr_cols,
+            blocked_update_fields=blocked_update_fields,
+        )
 
-        if upsert_dicts:
-            upsert_results = await data_manager_inst.upsert_rows(
-                upsert_dicts,
-                unique_constr_cols=unique_constr_cols,
-                blocked_update_fields=blocked_update_fields,
-            )
-            return upsert_results
+    async def upsert_ids(
+        self,
+        schemas: list[UpsertSchemaType],
+        *,
+        unique_constr_cols: Iterable[str],
+        blocked_update_fields: Iterable[str] = ("id", "created_at"),
+    ) -> list[uuid.UUID]:
+        """
+        as upsert, but only returns ids of the upserted records (no ORM models loaded).
+        """
+        if not schemas:
+            log.warning("No schemas provided for upsert")
+            return []
 
-        return []
+        upsert_dicts = self._to_upsert_dicts(schemas)
+        return await self._dm.upsert_rows(
+            upsert_dicts,
+            unique_constr_cols=unique_constr_cols,
+            blocked_update_fields=blocked_update_fields,
+            ids_only=True,
+        )
 
     async def delete(
         self,
         ids: Sequence[uuid.UUID],
     ) -> None:
 
-        data_manager_inst = self.data_manager(self.session, self.model)
-
-        existing_models, _ = await data_manager_inst.get_all_paginated(
+        existing_ids, _ = await self._dm.get_all_paginated(
             ids=ids,
             page_params=PageParams(current_page=1, page_size=len(ids)),
             sort_params=SortParams(sort_by="id", sort_direction="asc"),
+            column=getattr(self.model, "id"),
         )
-        existing_ids = [getattr(m, "id") for m in existing_models]
         self._check_for_missing_ids(
             existing_ids, ids, f"{self.model.__tablename__.replace('_', ' ').title()}"
         )
 
-        await data_manager_inst.delete_rows(existing_models)
+        await self._dm.delete_rows_by_ids(existing_ids)
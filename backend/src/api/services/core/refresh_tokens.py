@@ -6,6 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.db.models.core.refresh_tokens import RefreshTokensModel
 from api import JWT_REFRESH_TOKEN_EXPIRE_DAYS
 
+_UTC = timezone.utc
+_REFRESH_DELTA = timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+
 
 class RefreshTokensService:
     """Service for managing refresh tokens."""
@@ -17,9 +20,7 @@ class RefreshTokensService:
         self, user_id: uuid.UUID, token_hash: str
     ) -> RefreshTokensModel:
 
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            days=JWT_REFRESH_TOKEN_EXPIRE_DAYS
-        )
+        expires_at = datetime.now(_UTC) + _REFRESH_DELTA
 
         refresh_token = RefreshTokensModel(
             user_id=user_id,
@@ -29,14 +30,13 @@ class RefreshTokensService:
 
         self.session.add(refresh_token)
         await self.session.flush()
-        await self.session.refresh(refresh_token)
         return refresh_token
 
     async def get_refresh_token_by_hash(
         self, token_hash: str
     ) -> RefreshTokensModel | None:
 
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
 
         stmt = select(RefreshTokensModel).where(
             RefreshTokensModel.token_hash == token_hash,
@@ -56,12 +56,12 @@ class RefreshTokensService:
         token = result.scalar_one_or_none()
 
         if token:
-            token.revoked_at = datetime.now(timezone.utc)
+            token.revoked_at = datetime.now(_UTC)
             await self.session.flush()
 
     async def revoke_all_user_tokens(self, user_id: uuid.UUID) -> None:
 
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
 
         stmt = select(RefreshTokensModel).where(
             RefreshTokensModel.user_id == user_id,
@@ -83,7 +83,7 @@ class RefreshTokensService:
         Remove expired and revoked tokens from the database
         returns # deleted tokens
         """
-        now = datetime.now(timezone.utc)
+        now = datetime.now(_UTC)
 
         stmt = select(RefreshTokensModel).where(
             (RefreshTokensModel.expires_at < now)
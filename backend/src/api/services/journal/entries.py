@@ -1,74 +1,68 @@
 import datetime as dt
 import uuid
-from typing import TYPE_CHECKING, Protocol, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+from api.db.base_data_manager import DataValidationError
 from api.db.data_managers.journal.entries import EntriesDataManager
 from api.db.models.journal.entries import EntriesModel
 from api.api_schemas.journal.entries import (
     EntryCreateSchema,
     EntryPatchSchema,
+    EncryptedCreateSchema,
     EncryptedPatchSchema,
 )
-from api.services.base_service import BaseService
-from api.services.journal.threads import ThreadsService
-from api.api_schemas.journal.threads import ThreadUpsertSchema
+from api.services.base_service import BaseService, get_utc_now
 from api.utils.encryption import get_encryption_service
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.utils.logger import log
-
 if TYPE_CHECKING:
     # avoids a circular import only used for type checking threads..
     from api.db.models.journal.threads import ThreadsModel
     from api.api_schemas.generic import PageParams, SortParams
 
 
-class DecryptedEntryModel(Protocol):
-    """EntriesModel with decrypted raw_markdown attribute"""
+@dataclass(slots=True, frozen=True)
+class DecryptedEntry:
+    """read-only projection of an entry with its markdown decrypted.
+    - detached from the session, so there's nothing for sqlalch to track or flush back
+    """
 
     id: uuid.UUID
     thread_id: uuid.UUID
-    encrypted_markdown: str | None
     raw_markdown: str | None
     written_at: dt.datetime
     created_at: dt.datetime
     updated_at: dt.datetime
 
+    @classmethod
+    def from_model(
+        cls, entry: EntriesModel, raw_markdown: str | None
+    ) -> "DecryptedEntry":
+        return cls(
+            id=entry.id,
+            thread_id=entry.thread_id,
+            raw_markdown=raw_markdown,
+            written_at=entry.written_at,
+            created_at=entry.created_at,
+            updated_at=entry.updated_at,
+        )
+
 
 def populate_create_model(
-    schema: EntryCreateSchema,
+    schema: EncryptedCreateSchema,
     current_time: dt.datetime,
 ):
-    """Convert EntryCreateSchema to EntriesModel instance."""
-    encryption_service = get_encryption_service()
-    schema_dict = schema.model_dump()
-
-    # don't store raw md, encrypt it first
-    raw_markdown = schema_dict.pop("raw_markdown", None)
-    if raw_markdown is not None:
-        try:
-            encrypted_markdown = encryption_service.encrypt(raw_markdown)
-            if encrypted_markdown is None:
-                log.error("populate_create_model() - encryption returned None")
-                raise ValueError(
-                    "Encryption returned None - data would be stored unencrypted"
-                )
-            schema_dict["encrypted_markdown"] = encrypted_markdown
-        except Exception as e:
-
-            raise ValueError(
-                f"Encryption failed - cannot store unencrypted data: {e}"
-            ) from e
-
-    schema_dict.update(
-        {
-            "created_at": current_time,
-            "updated_at": current_time,
-            "written_at": current_time,
-        }
+    """Convert EncryptedCreateSchema to EntriesModel instance.
+    - markdown is already encrypted by create_with_encryption (in one batch), raw md is never stored
+    """
+    return EntriesModel(
+        thread_id=schema.thread_id,
+        encrypted_markdown=schema.encrypted_markdown,
+        created_at=current_time,
+        updated_at=current_time,
+        written_at=current_time,
     )
 
-    return EntriesModel(**schema_dict)
-
 
 class EntriesService(
     BaseService[
@@ -90,80 +84,106 @@ class EntriesService(
             to_create_model=populate_create_model,
         )
         self._encryption_service = get_encryption_service()
+        # bound once per service rather than looked up per entry in list decrypts
+        self._decrypt = self._encryption_service.decrypt_required
+
+    def _decrypt_entry(self, entry: EntriesModel) -> DecryptedEntry:
+        """Decrypt encrypted_markdown field of an entry model into a DecryptedEntry."""
+        encrypted_value = entry.encrypted_markdown
+        return DecryptedEntry.from_model(
+            entry, None if encrypted_value is None else self._decrypt(encrypted_value)
+        )
 
-    def _decrypt_entry(self, entry: EntriesModel) -> DecryptedEntryModel:
-        """Decrypt encrypted_markdown field in an entry model and set as raw_markdown."""
-        if entry.encrypted_markdown is not None:
-            encrypted_value = entry.encrypted_markdown
-            decrypted = self._encryption_service.decrypt(encrypted_value)
-            # seen issues w type checker & SQLAlchemy mapped columns, so use setattr here
-            setattr(entry, "raw_markdown", decrypted)
-        return entry  # type: ignore[return-value]
-
-    def _decrypt_entries(
-        self, entries: list[EntriesModel]
-    ) -> list[DecryptedEntryModel]:
+    def _decrypt_entries(self, entries: list[EntriesModel]) -> list[DecryptedEntry]:
         """Decrypt encrypted_markdown field in a list of entry models."""
-        for entry in entries:
-            self._decrypt_entry(entry)
-        return entries  # type: ignore[return-value]
+        decrypted_values = self._encryption_service.decrypt_many(
+            [entry.encrypted_markdown for entry in entries]
+        )
+        return [
+            DecryptedEntry.from_model(entry, decrypted)
+            for entry, decrypted in zip(entries, decrypted_values)
+        ]
 
-    async def _prevent_sqlalch_tracking_entries_further(
+    async def _decrypt_entries_concurrently(
         self, entries: list[EntriesModel]
-    ) -> None:
-        """without this, when decrypting, sqlalch will overwrite the encrypted data with the decrypted data on commit,
-        which makes the entire encryption process pointless. This works, tells sqlalch to ignore enries.
-        Call before decrypyting
-        """
-        # Ensure encrypted data is flushed to database before expunging
-        await self.session.flush()
-        for entry in entries:
-            try:
-                self.session.expunge(entry)
-            except Exception as e:
-                log.warning(f"Failed to expunge entry {entry.id}: {e}")
+    ) -> list[DecryptedEntry]:
+        """as _decrypt_entries, but large pages are decrypted in chunks on a thread pool."""
+        decrypted_values = await self._encryption_service.decrypt_many_async(
+            [entry.encrypted_markdown for entry in entries]
+        )
+        return [
+            DecryptedEntry.from_model(entry, decrypted)
+            for entry, decrypted in zip(entries, decrypted_values)
+        ]
 
     async def create_with_encryption(
         self,
         schemas: list[EntryCreateSchema],
-    ) -> list[DecryptedEntryModel]:
-        """Create entries with encrypted markdown and return decrypted."""
-        entries = await super().create(schemas=schemas)
-        await self._prevent_sqlalch_tracking_entries_further(entries)
-        return self._decrypt_entries(entries)
+    ) -> list[DecryptedEntry]:
+        """Create entries with encrypted markdown and return decrypted.
+        - encrypts the whole batch in one call, then hands back the request's plaintext
+          rather than decrypting what was just encrypted
+        """
+        raw_markdowns = [schema.raw_markdown for schema in schemas]
+        try:
+            encrypted_values = await self._encryption_service.encrypt_many_async(
+                raw_markdowns
+            )
+        except Exception as e:
+
+            raise ValueError(
+                f"Encryption failed - cannot store unencrypted data: {e}"
+            ) from e
+
+        # values already validated on the incoming schema, so skip re-validation
+        encrypted_schemas: list[EntryCreateSchema] = [
+            EncryptedCreateSchema.model_construct(
+                thread_id=schema.thread_id, encrypted_markdown=encrypted_markdown
+            )
+            for schema, encrypted_markdown in zip(schemas, encrypted_values)
+        ]
+        entries = await super().create(schemas=encrypted_schemas)
+        return [
+            DecryptedEntry.from_model(entry, raw_markdown)
+            for entry, raw_markdown in zip(entries, raw_markdowns)
+        ]
 
     async def patch_with_encryption(
         self,
         schemas: list[EntryPatchSchema],
-    ) -> list[DecryptedEntryModel]:
+    ) -> list[DecryptedEntry]:
         """Patch entries with encrypted markdown and return decrypted."""
-        # encrypt md before patching
-        encrypted_schemas: list[EntryPatchSchema] = []
-        for _, schema in enumerate(schemas):
-            schema_dict = schema.model_dump(exclude_unset=True)
-            raw_markdown = schema_dict.pop("raw_markdown", None)
-            if raw_markdown is not None:
-                try:
-                    encrypted_markdown = self._encryption_service.encrypt(raw_markdown)
-                    if encrypted_markdown is None:
-                        raise ValueError("Encryption returned None during patch")
-                    schema_dict["encrypted_markdown"] = encrypted_markdown
-                    encrypted_schema = EncryptedPatchSchema(**schema_dict)
-                    encrypted_schemas.append(encrypted_schema)
-                except Exception as e:
+        # encrypt md before patching, in one batch
+        to_encrypt = [
+            (i, schema)
+            for i, schema in enumerate(schemas)
+            if schema.raw_markdown is not None
+        ]
+        try:
+            encrypted_values = await self._encryption_service.encrypt_many_async(
+                [schema.raw_markdown for _, schema in to_encrypt]
+            )
+        except Exception as e:
+
+            raise ValueError(f"Encryption failed during patch: {e}") from e
 
-                    raise ValueError(f"Encryption failed during patch: {e}") from e
-            else:
-                encrypted_schemas.append(schema)
+        encrypted_schemas: list[EntryPatchSchema] = list(schemas)
+        for (i, schema), encrypted_markdown in zip(to_encrypt, encrypted_values):
+            fields_set = schema.model_fields_set - {"raw_markdown"}
+            # values already validated on the incoming schema, so skip re-validation
+            encrypted_schemas[i] = EncryptedPatchSchema.model_construct(
+                _fields_set=fields_set | {"encrypted_markdown"},
+                **{k: getattr(schema, k) for k in fields_set},
+                encrypted_markdown=encrypted_markdown,
+            )
 
         entries = await super().patch(schemas=encrypted_schemas)
-        await self._prevent_sqlalch_tracking_entries_further(entries)
         return self._decrypt_entries(entries)
 
     async def get_one_or_none_by_id_with_decryption(
         self,
         id: uuid.UUID,
-    ) -> DecryptedEntryModel | None:
+    ) -> DecryptedEntry | None:
         """Get entry by ID and decrypt encrypted_markdown."""
         entry = await super().get_one_or_none_by_id(id)
         if entry:
@@ -175,34 +195,30 @@ class EntriesService(
         ids: Sequence[uuid.UUID] | None,
         page_params: "PageParams",
         sort_params: "SortParams",
-    ) -> tuple[list[DecryptedEntryModel], int]:
+    ) -> tuple[list[DecryptedEntry], int]:
         """Get paginated entries and decrypt encrypted_markdown."""
         entries, total = await super().get_all_paginated(
             ids=ids,
             page_params=page_params,
             sort_params=sort_params,
         )
-        return (self._decrypt_entries(entries), total)
+        return (await self._decrypt_entries_concurrently(entries), total)
 
     async def get_entries_by_date(
         self, user_id: uuid.UUID, date: dt.date
-    ) -> list[tuple[DecryptedEntryModel, "ThreadsModel"]]:
+    ) -> list[tuple[DecryptedEntry, "ThreadsModel"]]:
         """get all entries for a specific date with their threads."""
-        data_manager_inst = self.data_manager(self.session, self.model)
-        entries_with_threads = await data_manager_inst.get_entries_by_date(
-            user_id, date
+        entries_with_threads = await self._dm.get_entries_by_date(user_id, date)
+        # Decrypt encrypted_markdown for all entries, in one batch
+        decrypted_entries = self._decrypt_entries(
+            [entry for entry, _ in entries_with_threads]
         )
-        # Decrypt encrypted_markdown for all entries
-        # expunge entries before decrypting to prevent SQLAlchemy from writing decrypted values back
-        entries_list = [entry for entry, _ in entries_with_threads]
-        await self._prevent_sqlalch_tracking_entries_further(entries_list)
-        decrypted_results = [
-            (self._decrypt_entry(entry), thread)
-            for entry, thread in zip(
-                entries_list, [thread for _, thread in entries_with_threads]
+        return [
+            (decrypted_entry, thread)
+            for decrypted_entry, (_, thread) in zip(
+                decrypted_entries, entries_with_threads
             )
         ]
-        return decrypted_results
 
     async def get_days_with_entries(
         self, user_id: uuid.UUID, start_date: dt.date, end_date: dt.date
@@ -210,63 +226,44 @@ class EntriesService(
         """
         get all dates in a range that have at least one entry.
         """
-        data_manager_inst = self.data_manager(self.session, self.model)
-        return await data_manager_inst.get_dates_with_entries(
-            user_id, start_date, end_date
-        )
+        return await self._dm.get_dates_with_entries(user_id, start_date, end_date)
 
     async def create_entry_with_thread(
         self, user_id: uuid.UUID, date: dt.date, raw_markdown: str | None = None
-    ) -> DecryptedEntryModel:
+    ) -> DecryptedEntry:
         """
         create an entry and upsert the thread for the given date.
+        - thread upsert and entry insert are one statement (see data manager)
         """
-        threads_service = ThreadsService(self.session)
-        thread_schema = ThreadUpsertSchema(user_id=user_id, date=date)
-        threads = await threads_service.upsert(
-            schemas=[thread_schema],
-            unique_constr_cols=("user_id", "date"),
-            blocked_update_fields=["id", "created_at"],
+        encrypted_markdown = None
+        if raw_markdown is not None:
+            try:
+                encrypted_markdown = self._encryption_service.encrypt_required(
+                    raw_markdown
+                )
+            except Exception as e:
+                raise ValueError(
+                    f"Encryption failed - cannot store unencrypted data: {e}"
+                ) from e
+
+        entry = await self._dm.create_entry_with_thread(
+            user_id=user_id,
+            date=date,
+            encrypted_markdown=encrypted_markdown,
+            current_time=get_utc_now(),
         )
 
-        if not threads:
-            raise ValueError("Failed to create or retrieve thread")
-        if len(threads) != 1:
-            raise ValueError(f"Expected exactly one thread, but got {len(threads)}")
-        thread = threads[0]
-
-        entry_schema = EntryCreateSchema(thread_id=thread.id, raw_markdown=raw_markdown)
-        entries = await self.create_with_encryption(schemas=[entry_schema])
-
-        if not entries:
-            raise ValueError("Failed to create entry")
-
-        if len(entries) != 1:
-            raise ValueError(f"Expected exactly one entry, but got {len(entries)}")
-        return entries[0]
+        # no need to decrypt what was just encrypted
+        return DecryptedEntry.from_model(entry, raw_markdown)
 
     async def delete_entry_with_thread_cleanup(self, entry_id: uuid.UUID) -> None:
         """
         delete an entry and its thread if it's the last entry in the thread.
         """
-        data_manager_inst = self.data_manager(self.session, self.model)
-        entry = await data_manager_inst.get_entry_with_thread(entry_id)
-
-        if not entry:
-            from api.db.base_data_manager import DataValidationError
+        deleted = await self._dm.delete_entry_and_maybe_thread(entry_id)
 
+        if not deleted:
             raise DataValidationError(
                 f"Entry not found for id {entry_id}",
                 code=404,
             )
-
-        thread_id = entry.thread_id
-
-        await self.delete(ids=[entry_id])
-
-        entry_count = await data_manager_inst.count_entries_in_thread(thread_id)
-
-        # If no other entries exist, delete the thread
-        if entry_count == 0:
-            threads_service = ThreadsService(self.session)
-            await threads_service.delete(ids=[thread_id])
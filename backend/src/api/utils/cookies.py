@@ -5,7 +5,7 @@ from fastapi import Request, Response
 from starlette.responses import Response as StarletteResponse
 
 from api import COOKIE_SECURE, COOKIE_SAME_SITE
-
+from api.utils.logger import log
 
 # Cookie names
 ACCESS_TOKEN_COOKIE = "access_token"
@@ -16,6 +16,51 @@ CSRF_TOKEN_COOKIE = "csrf_token"
 COOKIE_PATH = "/api"
 COOKIE_HTTP_ONLY = True
 
+# validated once at import rather than on every auth response
+_SAMESITE: Literal["lax", "strict", "none"] | None = (
+    COOKIE_SAME_SITE  # type: ignore[assignment]
+    if COOKIE_SAME_SITE in ("lax", "strict", "none")
+    else None
+)
+if _SAMESITE is None:
+    log.warning(
+        f"COOKIE_SAME_SITE={COOKIE_SAME_SITE!r} is not one of lax/strict/none, "
+        "auth cookies will be set without a SameSite attribute"
+    )
+
+
+def _cookie_attrs(
+    samesite: Literal["lax", "strict", "none"] | None, secure: bool
+) -> str:
+    """
+    the attributes written after Max-Age, as starlette's set_cookie writes them.
+    - http.cookies sorts attributes by name: HttpOnly, Max-Age, Path, SameSite, Secure
+    """
+    return (
+        f"; Path={COOKIE_PATH}"
+        + (f"; SameSite={samesite}" if samesite else "")
+        + ("; Secure" if secure else "")
+    )
+
+
+# attributes shared by every auth cookie, pre-formatted once so each response only
+# joins name/value/max-age onto them (same bytes as starlette's set_cookie)
+_HTTP_ONLY_ATTR = "; HttpOnly" if COOKIE_HTTP_ONLY else ""
+_COOKIE_ATTRS = _cookie_attrs(_SAMESITE, COOKIE_SECURE)
+
+
+def _set_cookie_header(name: str, value: str, max_age: int) -> tuple[bytes, bytes]:
+    """
+    build a raw set-cookie header.
+    - values are our own JWTs / urlsafe tokens, so no cookie quoting is needed
+    """
+    return (
+        b"set-cookie",
+        f"{name}={value}{_HTTP_ONLY_ATTR}; Max-Age={max_age}{_COOKIE_ATTRS}".encode(
+            "latin-1"
+        ),
+    )
+
 
 def set_auth_cookies(
     response: Response | StarletteResponse,
@@ -34,57 +79,24 @@ def set_auth_cookies(
         access_token_max_age: Max age for access token cookie in seconds
         refresh_token_max_age: Max age for refresh token cookie in seconds
     """
-
-    samesite: Literal["lax", "strict", "none"] | None = None
-    if COOKIE_SAME_SITE in ("lax", "strict", "none"):
-        samesite = COOKIE_SAME_SITE  # type: ignore[assignment]
-
-    response.set_cookie(
-        key=ACCESS_TOKEN_COOKIE,
-        value=access_token,
-        max_age=access_token_max_age,
-        path=COOKIE_PATH,
-        httponly=COOKIE_HTTP_ONLY,
-        secure=COOKIE_SECURE,
-        samesite=samesite,
-    )
-
-    response.set_cookie(
-        key=REFRESH_TOKEN_COOKIE,
-        value=refresh_token,
-        max_age=refresh_token_max_age,
-        path=COOKIE_PATH,
-        httponly=COOKIE_HTTP_ONLY,
-        secure=COOKIE_SECURE,
-        samesite=samesite,
+    response.raw_headers.extend(
+        (
+            _set_cookie_header(ACCESS_TOKEN_COOKIE, access_token, access_token_max_age),
+            _set_cookie_header(
+                REFRESH_TOKEN_COOKIE, refresh_token, refresh_token_max_age
+            ),
+        )
     )
 
 
 def clear_auth_cookies(response: Response | StarletteResponse) -> None:
     """set access_token and refresh_token to expire immediately."""
-
-    samesite: Literal["lax", "strict", "none"] | None = None
-    if COOKIE_SAME_SITE in ("lax", "strict", "none"):
-        samesite = COOKIE_SAME_SITE  # type: ignore[assignment]
-
-    response.set_cookie(
-        key=ACCESS_TOKEN_COOKIE,
-        value="",
-        max_age=0,
-        path=COOKIE_PATH,
-        httponly=COOKIE_HTTP_ONLY,
-        secure=COOKIE_SECURE,
-        samesite=samesite,
-    )
-
-    response.set_cookie(
-        key=REFRESH_TOKEN_COOKIE,
-        value="",
-        max_age=0,
-        path=COOKIE_PATH,
-        httponly=COOKIE_HTTP_ONLY,
-        secure=COOKIE_SECURE,
-        samesite=samesite,
+    # an empty value is written quoted, as http.cookies does
+    response.raw_headers.extend(
+        (
+            _set_cookie_header(ACCESS_TOKEN_COOKIE, '""', 0),
+            _set_cookie_header(REFRESH_TOKEN_COOKIE, '""', 0),
+        )
     )
 
 
@@ -1,42 +1,74 @@
 """
 encryption utility - see adr-003-encryption-choice.md
+- new values are AES-256-GCM, older Fernet values still decrypt (see _is_fernet_token)
+- both are backed by OpenSSL EVP, so AES rounds use AES-NI where the cpu has it
 """
 
+import asyncio
+import base64
+import functools
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from api.utils.logger import log
 
+# token layout: version (1 byte) | nonce (12 bytes) | ciphertext + GCM tag (16 bytes)
+# - the version byte is also passed as associated data, so it can't be swapped undetected
+_AESGCM_VERSION = b"\x01"
+_NONCE_LEN = 12
+_AESGCM_KEY_INFO = b"daily_journal entries aes-256-gcm"
+
+# batches larger than this are split into chunks run across a thread pool, below it the
+# executor hand-off costs more than it saves
+_PARALLEL_THRESHOLD = 8
+_CRYPTO_WORKERS = min(4, os.cpu_count() or 1)
+_CRYPTO_POOL = ThreadPoolExecutor(
+    max_workers=_CRYPTO_WORKERS, thread_name_prefix="crypto"
+)
 
-class EncryptionService:
-    """
-    encrypt and decrypt data using Fernet.
 
-    NOTE: singleton pattern used, as I need to ensure Fernet instance initialized once only
-    otherwise, with encryption key loaded multiple times, this won't work
+def _is_fernet_token(token: bytes) -> bool:
     """
+    Fernet tokens start with a 0x80 version byte, which always base64-encodes to a leading "g"
+    - AES-GCM tokens start with 0x01, i.e. a leading "A", so no need to decode to tell them apart
+    """
+    return token[:1] == b"g"
 
-    _instance: Optional["EncryptionService"] = None
-    _fernet: Optional[Fernet] = None
 
-    def __new__(cls) -> "EncryptionService":
-        """singleton pattern to ensure single instance"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+@dataclass(slots=True, frozen=True)
+class EncryptionService:
+    """
+    encrypt data using AES-256-GCM, decrypt either AES-256-GCM or legacy Fernet data.
 
-    def _initialize(self) -> None:
-        encryption_key = os.environ.get("ENCRYPTION_KEY")
+    NOTE: build via get_encryption_service(), which caches a single process-wide instance
+    rather than loading the encryption key on every call
+    """
 
-        if not encryption_key:
-            raise ValueError(
-                "ENCRYPTION_KEY environment variable is required for encryption. "
-                "Please set it in your environment or .env file."
-            )
+    fernet: Fernet
+    aead: AESGCM
 
+    @classmethod
+    def from_key(cls, encryption_key: str) -> "EncryptionService":
         try:
-            self._fernet = Fernet(encryption_key.encode())
+            raw_key = base64.urlsafe_b64decode(encryption_key)
+            return cls(
+                fernet=Fernet(encryption_key.encode()),
+                # derive a separate key rather than reusing Fernet's signing/encryption halves
+                aead=AESGCM(
+                    HKDF(
+                        algorithm=hashes.SHA256(),
+                        length=32,
+                        salt=None,
+                        info=_AESGCM_KEY_INFO,
+                    ).derive(raw_key)
+                ),
+            )
         except Exception as e:
             raise ValueError(
                 f"Failed to initialize encryption service. "
@@ -44,31 +76,93 @@ class EncryptionService:
                 f"Error: {e}"
             ) from e
 
-    def encrypt(self, plaintext: Optional[str]) -> Optional[str]:
-        if plaintext is None:
-            return None
-
-        if self._fernet is None:
-            raise RuntimeError("Encryption service not initialized")
-
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """
+        encrypt raw bytes into a base64url token, as Fernet.encrypt does.
+        - no str round-trips, errors are left as raised by cryptography
+        """
+        nonce = os.urandom(_NONCE_LEN)
+        ct = self.aead.encrypt(nonce, plaintext, _AESGCM_VERSION)
+        return base64.urlsafe_b64encode(_AESGCM_VERSION + nonce + ct)
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """
+        decrypt a base64url token (AES-GCM or legacy Fernet) back to raw bytes.
+        - raises InvalidToken / InvalidTag if the token is corrupt or from another key
+        """
+        if _is_fernet_token(token):
+            # written before the switch to AES-GCM
+            return self.fernet.decrypt(token)
+
+        raw = base64.urlsafe_b64decode(token)
+        if raw[:1] != _AESGCM_VERSION:
+            raise InvalidToken
+        nonce = raw[1 : 1 + _NONCE_LEN]
+        return self.aead.decrypt(nonce, raw[1 + _NONCE_LEN :], _AESGCM_VERSION)
+
+    def _encrypt_str(self, plaintext: str) -> str:
+        return self.encrypt_bytes(plaintext.encode("utf-8")).decode("ascii")
+
+    def _decrypt_str(self, ciphertext: str) -> str:
+        return self.decrypt_bytes(ciphertext.encode("ascii")).decode("utf-8")
+
+    def encrypt_required(self, plaintext: str) -> str:
+        """encrypt a value the caller knows isn't None"""
         try:
-            encrypted_bytes = self._fernet.encrypt(plaintext.encode("utf-8"))
-            return encrypted_bytes.decode("utf-8")
+            return self._encrypt_str(plaintext)
         except Exception as e:
             log.error(f"Encryption failed: {e}")
             raise ValueError(f"Failed to encrypt data: {e}") from e
 
+    def decrypt_required(self, ciphertext: str) -> str:
+        """decrypt a value the caller knows isn't None"""
+        try:
+            return self._decrypt_str(ciphertext)
+        except (InvalidToken, InvalidTag) as e:
+            log.error(
+                f"Decryption failed: Invalid token (wrong key or corrupted data): {e}",
+                exc_info=True,
+            )
+            raise ValueError(
+                "Failed to decrypt data. This may indicate corrupted data or an incorrect encryption key."
+            ) from e
+        except Exception as e:
+            log.error(f"Decryption failed: {e}", exc_info=True)
+            raise ValueError(f"Failed to decrypt data: {e}") from e
+
+    def encrypt(self, plaintext: Optional[str]) -> Optional[str]:
+        if plaintext is None:
+            return None
+        return self.encrypt_required(plaintext)
+
     def decrypt(self, ciphertext: Optional[str]) -> Optional[str]:
         if ciphertext is None:
             return None
+        return self.decrypt_required(ciphertext)
+
+    def encrypt_many(self, plaintexts: Sequence[Optional[str]]) -> list[Optional[str]]:
+        """
+        encrypt a batch of plaintexts, preserving order and None values.
+        - as decrypt_many, each value is still its own token (own nonce), the per-call
+          setup is just done once for the batch
+        """
+        encrypt_str = self._encrypt_str
+        try:
+            return [None if pt is None else encrypt_str(pt) for pt in plaintexts]
+        except Exception as e:
+            log.error(f"Encryption failed: {e}")
+            raise ValueError(f"Failed to encrypt data: {e}") from e
 
-        if self._fernet is None:
-            raise RuntimeError("Encryption service not initialized")
-
+    def decrypt_many(self, ciphertexts: Sequence[Optional[str]]) -> list[Optional[str]]:
+        """
+        decrypt a batch of ciphertexts, preserving order and None values.
+        - each token has its own nonce + tag, so tokens can't be concatenated into a single
+          cipher call; this instead hoists the per-call setup out of the loop
+        """
+        decrypt_str = self._decrypt_str
         try:
-            decrypted_bytes = self._fernet.decrypt(ciphertext.encode("utf-8"))
-            return decrypted_bytes.decode("utf-8")
-        except InvalidToken as e:
+            return [None if ct is None else decrypt_str(ct) for ct in ciphertexts]
+        except (InvalidToken, InvalidTag) as e:
             log.error(
                 f"Decryption failed: Invalid token (wrong key or corrupted data): {e}",
                 exc_info=True,
@@ -80,10 +174,54 @@ class EncryptionService:
             log.error(f"Decryption failed: {e}", exc_info=True)
             raise ValueError(f"Failed to decrypt data: {e}") from e
 
+    async def encrypt_many_async(
+        self, plaintexts: Sequence[Optional[str]]
+    ) -> list[Optional[str]]:
+        """as encrypt_many, but large batches run in chunks on a thread pool"""
+        return await _run_chunked(self.encrypt_many, plaintexts)
+
+    async def decrypt_many_async(
+        self, ciphertexts: Sequence[Optional[str]]
+    ) -> list[Optional[str]]:
+        """as decrypt_many, but large batches run in chunks on a thread pool"""
+        return await _run_chunked(self.decrypt_many, ciphertexts)
 
+
+async def _run_chunked(
+    fn: Callable[[Sequence[Optional[str]]], list[Optional[str]]],
+    values: Sequence[Optional[str]],
+) -> list[Optional[str]]:
+    """
+    split values into one chunk per worker and run fn over them concurrently, keeping order.
+    - openssl releases the GIL while running the cipher, so chunks genuinely overlap
+    - small batches just run inline
+    """
+    if len(values) <= _PARALLEL_THRESHOLD or _CRYPTO_WORKERS == 1:
+        return fn(values)
+
+    chunk_size = -(-len(values) // _CRYPTO_WORKERS)
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(_CRYPTO_POOL, fn, values[i : i + chunk_size])
+            for i in range(0, len(values), chunk_size)
+        )
+    )
+    return [value for chunk in chunks for value in chunk]
+
+
+@functools.lru_cache(maxsize=1)
 def get_encryption_service() -> EncryptionService:
     """
-    get the singleton EncryptionService instance
-    this is just convenience - makes easier to ensure one instance only if this func used elsewhere
+    get the process-wide EncryptionService instance
+    - cached, so after the first call this is just a cache lookup
     """
-    return EncryptionService()
+    encryption_key = os.environ.get("ENCRYPTION_KEY")
+
+    if not encryption_key:
+        raise ValueError(
+            "ENCRYPTION_KEY environment variable is required for encryption. "
+            "Please set it in your environment or .env file."
+        )
+
+    return EncryptionService.from_key(encryption_key)
@@ -1,9 +1,9 @@
 import uuid
-from math import ceil
-from typing import Annotated
+from typing import Annotated, Iterable, Literal
 from fastapi import HTTPException, Query, status
 from api.api_schemas.generic import (
     DataResponse,
+    IdsResponse,
     PageParams,
     PaginatedResponse,
     SingleItemResponse,
@@ -11,29 +11,26 @@ from api.api_schemas.generic import (
 )
 from api.db.models.core.users import UsersModel
 
+_FORBIDDEN_DETAIL = "Forbidden: Cannot access or modify other users' data"
+
 
 def validate_page_params(
     current_page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=10000)] = 100,
 ) -> PageParams:
-    """validate valid page params passed"""
-    if page_size > 10000:
-        raise HTTPException(
-            status_code=404, detail=f"page_size must be <10000, not: {page_size}"
-        )
+    """validate valid page params passed
+    - bounds are enforced by Query() itself, which returns a 422 before this runs
+    """
     return PageParams(current_page=current_page, page_size=page_size)
 
 
 def validate_sort_params(
     sort_by: Annotated[str, Query()] = "id",
-    sort_direction: Annotated[str, Query()] = "asc",
+    sort_direction: Annotated[Literal["asc", "desc"], Query()] = "asc",
 ) -> SortParams:
-    """validate valid sort params passed"""
-    if sort_direction not in ["asc", "desc"]:
-        raise HTTPException(
-            status_code=404,
-            detail=f"sort_direction must be 'asc' or 'desc', not: {sort_direction}",
-        )
+    """validate valid sort params passed
+    - sort_direction is checked by the Literal annotation, so fastapi rejects others with a 422
+    """
     return SortParams(sort_by=sort_by, sort_direction=sort_direction)
 
 
@@ -42,18 +39,27 @@ def create_response(data: DataResponse) -> SingleItemResponse:
     return SingleItemResponse(data=data)
 
 
+def create_ids_response(ids: Iterable[uuid.UUID]) -> IdsResponse:
+    """given ids create the echo=false response, i.e. only the ids"""
+    return IdsResponse(ids=list(ids))
+
+
 def create_paged_response(
     page_params: PageParams,
     sort_params: SortParams,
     total_records: int,
     data: list[DataResponse],
 ) -> PaginatedResponse:
-    """given data and page params creates paginated response"""
-    return PaginatedResponse(
+    """given data and page params creates paginated response
+    - inputs are already validated, and the route's response_model validates the output,
+      so construct without validating a second time
+    """
+    return PaginatedResponse.model_construct(
         current_page=page_params.current_page,
         page_size=page_params.page_size,
         total_records=total_records,
-        total_pages=ceil(total_records / page_params.page_size),
+        # integer ceil, avoids going via float
+        total_pages=-(-total_records // page_params.page_size),
         sort_by=sort_params.sort_by,
         sort_direction=sort_params.sort_direction,
         data=data,
@@ -68,17 +74,20 @@ def validate_user_id_authorization(
     if user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Forbidden: Cannot access or modify other users' data",
+            detail=_FORBIDDEN_DETAIL,
         )
 
 
 def validate_user_ids_authorization(
-    user_ids: list[uuid.UUID],
+    user_ids: Iterable[uuid.UUID],
     current_user: UsersModel,
 ) -> None:
-    """prevent an authenticated user getting an alt user's data"""
-    if not all(user_id == current_user.id for user_id in user_ids):
+    """prevent an authenticated user getting an alt user's data
+    - accepts any iterable so callers can pass a generator, exits on first foreign id
+    """
+    current_user_id = current_user.id
+    if any(user_id != current_user_id for user_id in user_ids):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Forbidden: Cannot access or modify other users' data",
+            detail=_FORBIDDEN_DETAIL,
         )
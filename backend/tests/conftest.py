@@ -2,50 +2,86 @@
 pytest configuration and shared fixtures for testing the FastAPI backend.
 - pytest fixtures are used to setup and tear down the test environment
 - before any tests are run:
-  - set up dedicated test database
-  - run migrations
-  - start dedicated test API server
-  - wait for API server to be ready
+  - set up a template database and run migrations on it (once, even with pytest-xdist)
+  - clone the dedicated test database from the template
+  - if E2E=1, start dedicated test API server and wait for it to be ready
+    (otherwise requests go to the app in-process via TestClient)
 - after all tests are run:
-  - stop test API server
-  - drop test database
+  - stop test API server (E2E=1 only)
+  - drop test database, and the template
 - test data is loaded from the test_data directory
-- before/after each test fixtures run that create/delete test data required for the test
+- before each test fixtures run that create test data required for the test
   - e.g. to satisfy fk constraints
+  - everything the app writes during a test is rolled back afterwards (see db_transaction)
+  - with E2E=1 there's no shared transaction, so fixtures delete their data instead
 """
 
 import os
 import sys
 from pathlib import Path
-from typing import Generator
-import json
+from typing import AsyncIterator, Awaitable, Callable, Generator, Iterator, TypeVar
 import subprocess
 import time
 import atexit
+import contextlib
+import copy
+import functools
+import io
+import itertools
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import httpx
+import orjson
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2.extensions import connection as PgConnection
+from psycopg2 import sql as pg_sql
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+
+# resolved once, rather than wherever a path is needed
+_TESTS_DIR = Path(__file__).resolve().parent
+_BACKEND_DIR = _TESTS_DIR.parent
+_SRC_DIR = str(_BACKEND_DIR / "src")
 
 # JWT config before importing api modules so __init__ reads test vals
-TEST_JWT_SECRET_KEY = os.environ.get(
+# - setdefault, so values already in the env (e.g. inherited by xdist workers from the main process) win
+TEST_JWT_SECRET_KEY = os.environ.setdefault(
     "JWT_SECRET_KEY", "test-secret-key-for-jwt-tokens-do-not-use-in-production"
 )
-os.environ["JWT_SECRET_KEY"] = TEST_JWT_SECRET_KEY
-os.environ["JWT_ALGORITHM"] = os.environ.get("JWT_ALGORITHM", "HS256")
-os.environ["JWT_ACCESS_TOKEN_EXPIRE_MINUTES"] = os.environ.get(
-    "JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "15"
-)
-os.environ["JWT_REFRESH_TOKEN_EXPIRE_DAYS"] = os.environ.get(
-    "JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+os.environ.setdefault("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+os.environ.setdefault("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7")
+os.environ.setdefault("COOKIE_SECURE", "false")
+os.environ.setdefault("COOKIE_SAME_SITE", "lax")
+
+# pytest-xdist sets PYTEST_XDIST_WORKER (gw0, gw1, ...) in each worker process
+# - each worker gets its own db + api server, so workers never see each other's data
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_WORKER_NUM = int(_XDIST_WORKER.removeprefix("gw")) if _XDIST_WORKER else 0
+
+# dedicated test db configs
+_BASE_TEST_DB_NAME = os.environ.get("TEST_DB_NAME", "journal_db_test")
+TEST_DB_NAME = (
+    f"{_BASE_TEST_DB_NAME}_{_XDIST_WORKER}" if _XDIST_WORKER else _BASE_TEST_DB_NAME
 )
-os.environ["COOKIE_SECURE"] = os.environ.get("COOKIE_SECURE", "false")
-os.environ["COOKIE_SAME_SITE"] = os.environ.get("COOKIE_SAME_SITE", "lax")
+# migrated once per session, each test db is cloned from it
+TEST_TEMPLATE_DB_NAME = f"{_BASE_TEST_DB_NAME}_template"
+# use different port for test API to avoid conflicts with dev server
+TEST_API_PORT = int(os.environ.get("TEST_API_PORT", "8001")) + _WORKER_NUM
+# point the in-process app at the test db (must be set before api is imported)
+os.environ["DB_NAME"] = TEST_DB_NAME
+
+# set E2E=1 to run against a real uvicorn server, rather than calling the app in-process
+E2E = os.environ.get("E2E", "").lower() in ("1", "true")
 
 # add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from api.utils.logger import log
 from api import DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME  # noqa: E402
@@ -53,153 +89,213 @@ from api.services.core.auth import (
     create_access_token,
     create_refresh_token,
     hash_refresh_token,
+    verify_access_token,
 )  # noqa: E402
+from api.db.models.base import Base  # noqa: E402
 from api.db.models.core.users import UsersModel  # noqa: E402
+from api.db.models.journal.entries import EntriesModel  # noqa: E402
+from api.db.models.journal.metrics import MetricsModel  # noqa: E402
+from api.db.models.journal.threads import ThreadsModel  # noqa: E402
+from api.api_schemas.core.users import UserSchema  # noqa: E402
+from api.api_schemas.journal.entries import EntrySchema  # noqa: E402
+from api.api_schemas.journal.metrics import MetricSchema  # noqa: E402
+from api.api_schemas.journal.threads import ThreadSchema  # noqa: E402
+from api.utils.encryption import get_encryption_service  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+# a DATABASE_URL from .env (loaded by the api import above) would take precedence over DB_NAME
+os.environ.pop("DATABASE_URL", None)
+
+from api.routes.main import app  # noqa: E402
+from api.db.database import DBSessionDep, get_db_session, sessionmanager  # noqa: E402
+from api.middleware.auth import get_current_user  # noqa: E402
+from api.utils.cookies import get_access_token_from_cookie  # noqa: E402
+from fastapi import Request  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import URL, insert, inspect, literal, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession  # noqa: E402
 
-
-# dedicated test db configs
-TEST_DB_NAME = os.environ.get("TEST_DB_NAME", "journal_db_test")
-# use different port for test API to avoid conflicts with dev server
-TEST_API_PORT = int(os.environ.get("TEST_API_PORT", "8001"))
 TEST_API_BASE_URL = f"http://localhost:{TEST_API_PORT}"
 # Keep API_BASE_URL for backward compatibility, but default to test server
 API_BASE_URL = os.environ.get("API_BASE_URL", TEST_API_BASE_URL)
 
+# keep-alive pool for the E2E client, sized for AuthenticatedClient.gather
+# - plain HTTP/1.1: uvicorn doesn't serve HTTP/2
+_E2E_MAX_CONNECTIONS = 8
+_E2E_LIMITS = httpx.Limits(
+    max_connections=_E2E_MAX_CONNECTIONS, max_keepalive_connections=_E2E_MAX_CONNECTIONS
+)
+
 # Global variable to track test API server process
 _test_api_process: subprocess.Popen | None = None
 
+# connection args for every psycopg2 connection the fixtures open, bar the database
+# - sslmode: skip the SSL negotiation psycopg2's default ("prefer") tries first, unless USE_SSL
+# - application_name: so fixture connections are identifiable in pg_stat_activity
+_PG_KWARGS = dict(
+    host=DB_HOST,
+    port=DB_PORT,
+    user=DB_USER,
+    password=DB_PASSWORD,
+    sslmode=(
+        "require" if os.environ.get("USE_SSL", "false").lower() == "true" else "disable"
+    ),
+    application_name="pytest",
+    connect_timeout=2,
+)
+
+# per-db connection pools for the per-test fixture helpers (users, refresh tokens)
+# - saves a new connection + auth handshake on every fixture setup/teardown
+_pg_pools: dict[str, ThreadedConnectionPool] = {}
+
+
+@contextlib.contextmanager
+def _pg_connection(db_name: str) -> Iterator[PgConnection]:
+    """borrow a pooled connection to db_name, rolled back if the caller raises."""
+    pool = _pg_pools.get(db_name)
+    if pool is None:
+        pool = _pg_pools[db_name] = ThreadedConnectionPool(
+            minconn=1, maxconn=4, database=db_name, **_PG_KWARGS
+        )
+
+    conn = pool.getconn()
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+def _close_pg_pools() -> None:
+    """close pooled connections, e.g. before dropping the db they point at."""
+    while _pg_pools:
+        _, pool = _pg_pools.popitem()
+        pool.closeall()
+
 
-def check_pg_connection(max_retries: int = 5, retry_delay: float = 1.0) -> bool:
+def _backoff_delay(attempt: int, base: float = 0.01, cap: float = 0.5) -> float:
+    """exponential backoff for readiness polls: 10ms, 20ms, 40ms, ... capped at 0.5s."""
+    return min(cap, base * (2**attempt))
+
+
+def check_pg_connection(timeout: float = 5.0) -> bool:
     log.info(f"Checking PostgreSQL connection at {DB_HOST}:{DB_PORT}...")
 
-    for attempt in range(max_retries):
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
         try:
-            conn = psycopg2.connect(
-                host=DB_HOST,
-                port=DB_PORT,
-                user=DB_USER,
-                password=DB_PASSWORD,
-                # db irrel -- just want to check server is reachable
-                database="postgres",
-                connect_timeout=2,
-            )
+            # db irrel -- just want to check server is reachable
+            conn = psycopg2.connect(database="postgres", **_PG_KWARGS)
             conn.close()
-            log.info(f"PostgreSQL is available (attempt {attempt + 1}/{max_retries})")
+            log.info(f"PostgreSQL is available (attempt {attempt + 1})")
             return True
         except Exception as e:
-            if attempt == 0 or (attempt + 1) % 2 == 0:
+            if attempt == 0 or (attempt + 1) % 5 == 0:
                 log.info(
-                    f"Waiting for PostgreSQL... (attempt {attempt + 1}/{max_retries}): {type(e).__name__}"
+                    f"Waiting for PostgreSQL... (attempt {attempt + 1}): {type(e).__name__}"
                 )
 
-        if attempt < max_retries - 1:
-            time.sleep(retry_delay)
+        delay = _backoff_delay(attempt)
+        if time.monotonic() + delay > deadline:
+            break
+        time.sleep(delay)
+        attempt += 1
 
-    log.error(f"PostgreSQL failed to become available after {max_retries} attempts")
+    log.error(f"PostgreSQL failed to become available within {timeout:.0f}s")
     return False
 
 
 def wait_for_api_health(
-    api_url: str, max_retries: int = 10, retry_delay: float = 1.0
+    api_url: str, process: subprocess.Popen | None = None, timeout: float = 10.0
 ) -> bool:
-    """Wait for API server to be ready and healthy."""
+    """
+    Wait for API server to be ready and healthy.
+    - polls with exponential backoff, so a server that's up in ~100ms isn't waited on for a full second
+    - gives up straight away if the server process has exited
+    """
     log.info(f"Waiting for API server at {api_url} to be ready...")
     health_url = f"{api_url}/health"
 
-    last_error = None
-    for attempt in range(max_retries):
+    deadline = time.monotonic() + timeout
+    last_error: str | httpx.Response | None = None
+    attempt = 0
+    while True:
+        if process is not None and process.poll() is not None:
+            log.error(f"API server exited with code {process.returncode}")
+            return False
         try:
             response = httpx.get(health_url, timeout=2.0)
-            if response.status_code == 200:
-                health_data = response.json()
-                if health_data.get("database") == "connected":
-                    log.info(
-                        f"API server is ready (attempt {attempt + 1}/{max_retries})"
-                    )
-                    return True
-                else:
-                    # Server is responding but DB not connected
-                    last_error = (
-                        f"Database status: {health_data.get('database', 'unknown')}"
-                    )
-                    if "database_error" in health_data:
-                        last_error += f" - {health_data['database_error']}"
-            else:
-                # Server responded but with error status
-                try:
-                    error_data = response.json()
-                    last_error = f"HTTP {response.status_code}: {error_data}"
-                except Exception:
-                    last_error = f"HTTP {response.status_code}"
+            # 200 + X-DB header means the db is connected, no need to parse the body
+            if (
+                response.status_code == 200
+                and response.headers.get("X-DB") == "connected"
+            ):
+                log.info(f"API server is ready (attempt {attempt + 1})")
+                return True
+            last_error = response
         except httpx.ConnectError:
             last_error = "Connection refused - server not started yet"
         except Exception as e:
             last_error = f"{type(e).__name__}: {str(e)}"
             if attempt == 0 or (attempt + 1) % 5 == 0:
-                log.info(
-                    f"Waiting for API... (attempt {attempt + 1}/{max_retries}): {last_error}"
-                )
+                log.info(f"Waiting for API... (attempt {attempt + 1}): {last_error}")
 
-        if attempt < max_retries - 1:
-            time.sleep(retry_delay)
+        delay = _backoff_delay(attempt)
+        if time.monotonic() + delay > deadline:
+            break
+        time.sleep(delay)
+        attempt += 1
 
-    log.error(f"API server failed to become ready after {max_retries} attempts")
+    log.error(f"API server failed to become ready within {timeout:.0f}s")
+    if isinstance(last_error, httpx.Response):
+        # only parse the body on final failure, for the log
+        try:
+            last_error = (
+                f"HTTP {last_error.status_code}: {orjson.loads(last_error.content)}"
+            )
+        except Exception:
+            last_error = f"HTTP {last_error.status_code}"
     if last_error:
         log.error(f"Last error: {last_error}")
     return False
 
 
+# boots uvicorn directly, skipping `python -m uvicorn`'s module lookup and CLI parsing
+# - both loop + http impls come with uvicorn[standard], faster than asyncio + h11
+_UVICORN_BOOT_SCRIPT = """\
+import uvicorn
+uvicorn.run(
+    "api.routes.main:app",
+    host="127.0.0.1",
+    port={port},
+    log_level="warning",  # reduce noise from test server
+    access_log=False,
+    loop="uvloop",
+    http="httptools",
+)
+"""
+
+
 def start_test_api_server(db_name: str, port: int = TEST_API_PORT) -> subprocess.Popen:
-    """Start a dedicated test API server in a subprocess."""
+    """
+    Start a dedicated test API server in a subprocess.
+    - sys.executable is the interpreter running pytest (the venv's, if there is one), so its
+      packages are already importable; only src needs adding to PYTHONPATH
+    """
     log.info(f"Starting test API server on port {port} with database {db_name}...")
 
-    backend_dir = Path(__file__).resolve().parent.parent
-    src_dir = backend_dir / "src"
-    api_module = "api.routes.main:app"
     env = os.environ.copy()
 
-    # determine Python executable - use sys.executable (should be venv Python)
-    python_exe = sys.executable
-
-    # ensure venv properly inherited
-    if hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix:
-        # --> in a venv
-        venv_prefix = Path(sys.prefix)
-        venv_bin = venv_prefix / "bin"
-
-        if venv_bin.exists():
-            current_path = env.get("PATH", "")
-            # prepend venv bin to PATH to ensure venv packages are found
-            env["PATH"] = f"{venv_bin}:{current_path}"
-            env["VIRTUAL_ENV"] = str(venv_prefix)
-
-            # also add site-packages to PYTHONPATH as a safety measure
-            # (helps ensure packages are found even if venv activation isn't perfect)
-            site_packages = (
-                venv_prefix
-                / "lib"
-                / f"python{sys.version_info.major}.{sys.version_info.minor}"
-                / "site-packages"
-            )
-            if site_packages.exists():
-                pythonpath_parts = [str(site_packages)]
-            else:
-                pythonpath_parts = []
-        else:
-            pythonpath_parts = []
-    else:
-        pythonpath_parts = []
-
     # ensure PYTHONPATH includes src directory so api module can be found
-    pythonpath_parts.insert(0, str(src_dir))
-
-    # set PYTHONPATH
-    if pythonpath_parts:
-        existing_pythonpath = env.get("PYTHONPATH", "")
-        if existing_pythonpath:
-            env["PYTHONPATH"] = ":".join(pythonpath_parts + [existing_pythonpath])
-        else:
-            env["PYTHONPATH"] = ":".join(pythonpath_parts)
+    existing_pythonpath = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = (
+        os.pathsep.join((_SRC_DIR, existing_pythonpath))
+        if existing_pythonpath
+        else _SRC_DIR
+    )
 
     # set db config - these must be set before load_dotenv() runs
     env["DB_NAME"] = db_name
@@ -211,35 +307,10 @@ def start_test_api_server(db_name: str, port: int = TEST_API_PORT) -> subprocess
     # ensure we use the test db (not DATABASE_URL from .env)
     env.pop("DATABASE_URL", None)
 
-    # JWT config for test API server matching the config at top of file
-    env["JWT_SECRET_KEY"] = os.environ.get("JWT_SECRET_KEY", TEST_JWT_SECRET_KEY)
-    env["JWT_ALGORITHM"] = os.environ.get("JWT_ALGORITHM", "HS256")
-    env["JWT_ACCESS_TOKEN_EXPIRE_MINUTES"] = os.environ.get(
-        "JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "15"
-    )
-    env["JWT_REFRESH_TOKEN_EXPIRE_DAYS"] = os.environ.get(
-        "JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"
-    )
-    env["COOKIE_SECURE"] = os.environ.get("COOKIE_SECURE", "false")
-    env["COOKIE_SAME_SITE"] = os.environ.get("COOKIE_SAME_SITE", "lax")
-    # start uvicorn server
-    log.info(f"Using Python: {python_exe}")
-    log.info(f"PYTHONPATH: {env.get('PYTHONPATH', 'not set')}")
-
+    # JWT/cookie config for the test API server comes with os.environ, set at top of file
     process = subprocess.Popen(
-        [
-            python_exe,
-            "-m",
-            "uvicorn",
-            api_module,
-            "--host",
-            "127.0.0.1",
-            "--port",
-            str(port),
-            "--log-level",
-            "warning",  # reduce noise from test server
-        ],
-        cwd=backend_dir,
+        [sys.executable, "-c", _UVICORN_BOOT_SCRIPT.format(port=int(port))],
+        cwd=_BACKEND_DIR,
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,  # combine stderr with stdout for easier debugging
@@ -285,16 +356,15 @@ def stop_test_api_server(process: subprocess.Popen | None) -> None:
             pass
 
 
-def create_test_database(db_name: str) -> None:
+def create_test_database(db_name: str, template: str | None = None) -> None:
+    """
+    create db_name, if it doesn't already exist.
+    - with a template, db_name is cloned from it (schema included) rather than created empty,
+      and a leftover db_name from an interrupted run is dropped first, as it may be stale
+    """
     log.info(f"Creating test database: {db_name}")
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        # db doesn't matter, we're just using it to connect to the server
-        database="postgres",
-    )
+    # db doesn't matter, we're just using it to connect to the server
+    conn = psycopg2.connect(database="postgres", **_PG_KWARGS)
     conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
 
     try:
@@ -302,8 +372,16 @@ def create_test_database(db_name: str) -> None:
         cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (db_name,))
         exists = cursor.fetchone()
 
+        if exists and template:
+            log.info(f"Test database '{db_name}' left over, recreating from template")
+            cursor.execute(f'DROP DATABASE "{db_name}"')
+            exists = None
+
         if not exists:
-            cursor.execute(f'CREATE DATABASE "{db_name}"')
+            if template:
+                cursor.execute(f'CREATE DATABASE "{db_name}" TEMPLATE "{template}"')
+            else:
+                cursor.execute(f'CREATE DATABASE "{db_name}"')
             log.info(f"Test database '{db_name}' created successfully")
         else:
             log.info(f"Test database '{db_name}' already exists")
@@ -312,61 +390,110 @@ def create_test_database(db_name: str) -> None:
         conn.close()
 
 
+# DROP DATABASE ... WITH (FORCE) is pg 13+
+_PG_DROP_FORCE_MIN_VERSION = 130000
+
+
 def drop_test_database(db_name: str) -> None:
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        database="postgres",  # Connect to default postgres database
-    )
+    _close_pg_pools()
+    # Connect to default postgres database
+    conn = psycopg2.connect(database="postgres", **_PG_KWARGS)
     conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
 
     try:
         cursor = conn.cursor()
-        # terminate any active connections
-        cursor.execute(
-            """
-            SELECT pg_terminate_backend(pg_stat_activity.pid)
-            FROM pg_stat_activity
-            WHERE pg_stat_activity.datname = %s
-            AND pid <> pg_backend_pid()
-            """,
-            (db_name,),
-        )
-        # drop db
-        cursor.execute(f'DROP DATABASE IF EXISTS "{db_name}"')
+        if conn.server_version >= _PG_DROP_FORCE_MIN_VERSION:
+            # terminates any active connections and drops, atomically
+            # - no window for a new connection between the two, as below
+            cursor.execute(f'DROP DATABASE IF EXISTS "{db_name}" WITH (FORCE)')
+        else:
+            # terminate any active connections
+            cursor.execute(
+                """
+                SELECT pg_terminate_backend(pg_stat_activity.pid)
+                FROM pg_stat_activity
+                WHERE pg_stat_activity.datname = %s
+                AND pid <> pg_backend_pid()
+                """,
+                (db_name,),
+            )
+            # drop db
+            cursor.execute(f'DROP DATABASE IF EXISTS "{db_name}"')
         cursor.close()
     finally:
         conn.close()
 
 
 def run_migrations(db_name: str) -> None:
+    """
+    run alembic migrations on db_name, in-process rather than via the alembic cli.
+    - saves starting a new interpreter and re-importing sqlalchemy + the models
+    """
     log.info(f"Running migrations on test database: {db_name}")
-    alembic_dir = Path(__file__).resolve().parent.parent / "alembic"
-    env = os.environ.copy()
-    env["DB_NAME"] = db_name
+    # no ini file: env.py would otherwise fileConfig() its logging over pytest's
+    alembic_cfg = AlembicConfig()
+    alembic_cfg.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    # env.py reads DB_NAME from the (already imported) api package, so pass the url instead
+    db_url = URL.create(
+        "postgresql",
+        username=DB_USER,
+        password=DB_PASSWORD,
+        host=DB_HOST,
+        port=DB_PORT,
+        database=db_name,
+        query={
+            "sslmode": _PG_KWARGS["sslmode"],
+            "application_name": _PG_KWARGS["application_name"],
+        },
+    )
+    alembic_cfg.set_main_option(
+        "sqlalchemy.url",
+        # escaped, as ini options are %-interpolated
+        db_url.render_as_string(hide_password=False).replace("%", "%%"),
+    )
 
+    output = io.StringIO()
     try:
         log.info(f"Executing: alembic upgrade head (DB_NAME={db_name})")
-        result = subprocess.run(
-            ["alembic", "upgrade", "head"],
-            cwd=alembic_dir.parent,
-            env=env,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        if result.stdout:
-            log.debug(f"Alembic output: {result.stdout}")
+        with contextlib.redirect_stdout(output):
+            alembic_command.upgrade(alembic_cfg, "head")
+        if output.getvalue():
+            log.debug(f"Alembic output: {output.getvalue()}")
         log.info(f"Migrations completed successfully for database: {db_name}")
-    except subprocess.CalledProcessError as e:
-        log.error(f"Alembic migration failed: {e.stderr}")
-        if e.stdout:
-            log.error(f"Alembic stdout: {e.stdout}")
+    except Exception:
+        log.exception("Alembic migration failed")
+        if output.getvalue():
+            log.error(f"Alembic stdout: {output.getvalue()}")
         raise
 
 
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """
+    create and migrate the template db that each test db is cloned from.
+    - runs once in the main process, and before pytest-xdist starts its workers,
+      so migrations run once per session rather than once per worker
+    """
+    if _XDIST_WORKER or not check_pg_connection():
+        # no pg --> the test_database fixture reports it
+        return
+
+    create_test_database(TEST_TEMPLATE_DB_NAME)
+    migration_start = time.time()
+    run_migrations(TEST_TEMPLATE_DB_NAME)
+    migration_elapsed = time.time() - migration_start
+    log.info(f"Migrations completed in {migration_elapsed:.2f}s")
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    if _XDIST_WORKER:
+        return
+    # NOTE: deliberately not logging during teardown as pytest may have closed logging streams (errors here)
+    try:
+        drop_test_database(TEST_TEMPLATE_DB_NAME)
+    except Exception:
+        pass
+
+
 @pytest.fixture(scope="session")
 def test_database() -> Generator[str, None, None]:
     """session-scoped fixture that creates test db at start and drops it at end."""
@@ -387,54 +514,52 @@ def test_database() -> Generator[str, None, None]:
     log.info(f"PostgreSQL check completed in {pg_elapsed:.2f}s")
 
     db_create_start = time.time()
-    create_test_database(TEST_DB_NAME)
+    # already migrated in pytest_sessionstart, so no migrations to run here
+    create_test_database(TEST_DB_NAME, template=TEST_TEMPLATE_DB_NAME)
     db_create_elapsed = time.time() - db_create_start
     log.info(f"Database creation completed in {db_create_elapsed:.2f}s")
 
     try:
-        # run migrations
-        migration_start = time.time()
-        run_migrations(TEST_DB_NAME)
-        migration_elapsed = time.time() - migration_start
-        log.info(f"Migrations completed in {migration_elapsed:.2f}s")
-
-        # start dedicated test API server
-        api_start = time.time()
-        _test_api_process = start_test_api_server(TEST_DB_NAME, TEST_API_PORT)
-
-        # wait for API server to be ready
-        if not wait_for_api_health(TEST_API_BASE_URL):
-            # try to read error output from the subprocess for debugging
-            if _test_api_process:
-                try:
-                    # check if process is still running
-                    if _test_api_process.poll() is not None:
-                        # process has exited, try to read output
-                        try:
-                            stdout, _ = _test_api_process.communicate(timeout=1)
-                            if stdout:
-                                log.error("Test API server output:")
-                                for line in stdout.split("\n")[-30:]:  # Last 30 lines
-                                    if line.strip():
-                                        log.error(f"  {line}")
-                        except (subprocess.TimeoutExpired, ValueError):
-                            pass
-                except Exception:
-                    # if we can't read output, wtever. fail silently at this point
-                    pass
-
-            stop_test_api_server(_test_api_process)
-            _test_api_process = None
-            msg = "Test API server failed to start or become healthy"
-            log.error(msg)
-            pytest.fail(msg)
-
-        api_elapsed = time.time() - api_start
-        log.info(f"Test API server started and ready in {api_elapsed:.2f}s")
+        if E2E:
+            # start dedicated test API server
+            api_start = time.time()
+            _test_api_process = start_test_api_server(TEST_DB_NAME, TEST_API_PORT)
+
+            # wait for API server to be ready
+            if not wait_for_api_health(TEST_API_BASE_URL, _test_api_process):
+                # try to read error output from the subprocess for debugging
+                if _test_api_process:
+                    try:
+                        # check if process is still running
+                        if _test_api_process.poll() is not None:
+                            # process has exited, try to read output
+                            try:
+                                stdout, _ = _test_api_process.communicate(timeout=1)
+                                if stdout:
+                                    log.error("Test API server output:")
+                                    # Last 30 lines
+                                    for line in stdout.split("\n")[-30:]:
+                                        if line.strip():
+                                            log.error(f"  {line}")
+                            except (subprocess.TimeoutExpired, ValueError):
+                                pass
+                    except Exception:
+                        # if we can't read output, wtever. fail silently at this point
+                        pass
+
+                stop_test_api_server(_test_api_process)
+                _test_api_process = None
+                msg = "Test API server failed to start or become healthy"
+                log.error(msg)
+                pytest.fail(msg)
+
+            api_elapsed = time.time() - api_start
+            log.info(f"Test API server started and ready in {api_elapsed:.2f}s")
 
         setup_elapsed = time.time() - session_start
+        api_desc = TEST_API_BASE_URL if E2E else "in-process"
         log.info(
-            f"Test environment ready (database: {TEST_DB_NAME}, API: {TEST_API_BASE_URL}, setup took {setup_elapsed:.2f}s)"
+            f"Test environment ready (database: {TEST_DB_NAME}, API: {api_desc}, setup took {setup_elapsed:.2f}s)"
         )
         log.info("-" * 60)
         yield TEST_DB_NAME
@@ -462,17 +587,26 @@ def _cleanup_test_api():
 
 
 atexit.register(_cleanup_test_api)
+atexit.register(_close_pg_pools)
 
 # --------------------------------------------------------------------------------------------------------------------------------
 # auth utils
 # --------------------------------------------------------------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=256)
+def _create_test_access_token(user_id: uuid.UUID) -> str:
+    """sign a JWT access token once per test user, rather than per fixture call.
+    - expires after JWT_ACCESS_TOKEN_EXPIRE_MINUTES, like any other access token
+    """
+    return create_access_token(user_id)
+
+
 def _create_test_token(user_id: uuid.UUID) -> tuple[str, str]:
     """create JWT access token and refresh token for a test user.
     Returns tuple of (access_token, refresh_token).
     """
-    access_token = create_access_token(user_id)
+    access_token = _create_test_access_token(user_id)
     refresh_token = create_refresh_token()
     return access_token, refresh_token
 
@@ -486,15 +620,7 @@ def _create_test_refresh_token_record(
     token_hash = hash_refresh_token(refresh_token)
     expires_at = dt.datetime.now(dt.timezone.utc) + dt.timedelta(days=7)
 
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        database=db_name,
-    )
-
-    try:
+    with _pg_connection(db_name) as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -510,8 +636,76 @@ def _create_test_refresh_token_record(
             ),
         )
         conn.commit()
-    finally:
-        conn.close()
+
+
+# each worker has its own db, which starts empty, so worker tag + a process-local counter is unique
+# - no clock read or urandom syscall per value, as with time + uuid4
+_UNIQUE_TAG = _XDIST_WORKER or "main"
+_unique_counter = itertools.count()
+
+
+def _unique_suffix() -> str:
+    """unique suffix for test emails / auth subs."""
+    return f"{_UNIQUE_TAG}_{next(_unique_counter)}"
+
+
+def _user_row_to_dict(row: tuple) -> dict:
+    return {
+        "id": str(row[0]),
+        "email": row[1],
+        "external_auth_sub": row[2],
+        "name": row[3],
+        "picture": row[4],
+        "created_at": row[5].isoformat() if row[5] else None,
+        "updated_at": row[6].isoformat() if row[6] else None,
+        "last_login_at": row[7].isoformat() if row[7] else None,
+    }
+
+
+def bulk_create_test_users(db_name: str, specs: list[dict]) -> list[dict]:
+    """create test users directly in the database (bypassing API), in one round-trip.
+    - each spec may set email, external_auth_sub, name and picture; unique email/sub generated otherwise
+
+    Returns:
+        user data dicts, in the same order as specs
+    """
+    import datetime as dt
+
+    now = dt.datetime.now(dt.timezone.utc)
+    rows = []
+    for spec in specs:
+        suffix = _unique_suffix()
+        rows.append(
+            (
+                str(uuid.uuid4()),
+                spec.get("email") or f"test_{suffix}@example.com",
+                spec.get("external_auth_sub") or f"test_sub_{suffix}",
+                spec.get("name"),
+                spec.get("picture"),
+                now,
+                now,
+            )
+        )
+
+    with _pg_connection(db_name) as conn:
+        cursor = conn.cursor()
+        # fetch=True collects RETURNING rows across pages, in insert order
+        returned = execute_values(
+            cursor,
+            """
+            INSERT INTO core.users (id, email, external_auth_sub, name, picture, created_at, updated_at)
+            VALUES %s
+            RETURNING id, email, external_auth_sub, name, picture, created_at, updated_at, last_login_at
+            """,
+            rows,
+            page_size=200,
+            fetch=True,
+        )
+        conn.commit()
+
+    if len(returned) != len(specs):
+        raise ValueError("Not all users created in database")
+    return [_user_row_to_dict(row) for row in returned]
 
 
 def _create_test_user_in_db(
@@ -527,94 +721,80 @@ def _create_test_user_in_db(
     Returns:
         user data dict
     """
-    import datetime as dt
-
-    if email is None:
-        email = f"test_{int(time.time())}_{uuid.uuid4().hex[:8]}@example.com"
-    if external_auth_sub is None:
-        external_auth_sub = f"test_sub_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+    spec = {
+        "email": email,
+        "external_auth_sub": external_auth_sub,
+        "name": name,
+        "picture": picture,
+    }
+    return bulk_create_test_users(db_name, [spec])[0]
 
-    user_id = uuid.uuid4()
-    now = dt.datetime.now(dt.timezone.utc)
 
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        database=db_name,
-    )
-
-    try:
+def _delete_test_users_from_db(db_name: str, user_ids: list[str]) -> None:
+    """delete test users directly from the database, in one statement."""
+    for user_id in user_ids:
+        _current_users_by_id.pop(uuid.UUID(str(user_id)), None)
+    with _pg_connection(db_name) as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            INSERT INTO core.users (id, email, external_auth_sub, name, picture, created_at, updated_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            RETURNING id, email, external_auth_sub, name, picture, created_at, updated_at, last_login_at
-            """,
-            (str(user_id), email, external_auth_sub, name, picture, now, now),
+            "DELETE FROM core.users WHERE id = ANY(%s::uuid[])", (list(user_ids),)
         )
-        row = cursor.fetchone()
         conn.commit()
-        if row is None:
-            raise ValueError("No user created in database")
-
-        return {
-            "id": str(row[0]),
-            "email": row[1],
-            "external_auth_sub": row[2],
-            "name": row[3],
-            "picture": row[4],
-            "created_at": row[5].isoformat() if row[5] else None,
-            "updated_at": row[6].isoformat() if row[6] else None,
-            "last_login_at": row[7].isoformat() if row[7] else None,
-        }
-    finally:
-        conn.close()
 
 
 def _delete_test_user_from_db(db_name: str, user_id: str) -> None:
     """delete a test user directly from the database."""
-    conn = psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        database=db_name,
-    )
+    _delete_test_users_from_db(db_name, [user_id])
 
-    try:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM core.users WHERE id = %s", (user_id,))
-        conn.commit()
-    finally:
-        conn.close()
+
+class _OrjsonResponse:
+    """
+    thin proxy over httpx.Response whose .json() parses with orjson rather than the stdlib
+    - the parsed body is cached, so calling .json() again doesn't re-parse it
+    - everything else is passed through to the wrapped response
+    """
+
+    __slots__ = ("_response", "_json")
+
+    _UNPARSED = object()
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+        self._json = self._UNPARSED
+
+    def __getattr__(self, name: str):
+        return getattr(self._response, name)
+
+    def json(self, **kwargs):
+        if self._json is self._UNPARSED:
+            self._json = orjson.loads(self._response.content)
+        return self._json
 
 
 class AuthenticatedClient:
     """
     wrapper around httpx.Client, automatically adds auth cookies to all requests
+    - the wrapped client is either the in-process app client or a real http client (E2E=1)
     """
 
     def __init__(
         self,
-        base_url: str,
+        http_client: httpx.Client,
         access_token: str,
         refresh_token: str,
-        timeout: httpx.Timeout,
+        close_client: bool = True,
     ):
         self._access_token = access_token
         self._refresh_token = refresh_token
-        self._client = httpx.Client(
-            base_url=base_url, timeout=timeout, follow_redirects=True
-        )
+        self._client = http_client
+        # session-scoped clients are closed by their own fixture, not per test
+        self._close_client = close_client
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
-        self._client.close()
+        self.close()
 
     def _add_auth_cookies(self, cookies: dict | None) -> dict:
         """add auth cookies to request cookies"""
@@ -625,33 +805,67 @@ class AuthenticatedClient:
         cookies["refresh_token"] = self._refresh_token
         return cookies
 
-    def get(self, url: str, **kwargs):
-        kwargs.setdefault("cookies", {})
-        kwargs["cookies"] = self._add_auth_cookies(kwargs["cookies"])
-        return self._client.get(url, **kwargs)
-
-    def post(self, url: str, **kwargs):
-        kwargs.setdefault("cookies", {})
-        kwargs["cookies"] = self._add_auth_cookies(kwargs["cookies"])
-        return self._client.post(url, **kwargs)
-
-    def patch(self, url: str, **kwargs):
-        kwargs.setdefault("cookies", {})
-        kwargs["cookies"] = self._add_auth_cookies(kwargs["cookies"])
-        return self._client.patch(url, **kwargs)
-
-    def put(self, url: str, **kwargs):
-        kwargs.setdefault("cookies", {})
-        kwargs["cookies"] = self._add_auth_cookies(kwargs["cookies"])
-        return self._client.put(url, **kwargs)
+    def get(self, url: str, **kwargs) -> "_OrjsonResponse":
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> "_OrjsonResponse":
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> "_OrjsonResponse":
+        return self.request("PATCH", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> "_OrjsonResponse":
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> "_OrjsonResponse":
+        return self.request("DELETE", url, **kwargs)
+
+    def gather(self, requests: list[tuple[str, str, dict]]) -> list["_OrjsonResponse"]:
+        """
+        send (method, url, kwargs) requests, returning responses in the same order.
+        - E2E: sent concurrently over the client's keep-alive pool
+        - in-process: sent one at a time, as every request shares the test's one db connection
+        """
+        if not E2E:
+            return [
+                self.request(method, url, **kwargs) for method, url, kwargs in requests
+            ]
+        with ThreadPoolExecutor(max_workers=_E2E_MAX_CONNECTIONS) as executor:
+            return list(
+                executor.map(lambda r: self.request(r[0], r[1], **r[2]), requests)
+            )
 
-    def delete(self, url: str, **kwargs):
+    def request(self, method: str, url: str, **kwargs) -> "_OrjsonResponse":
+        """
+        send a request with the auth cookies added.
+        - a json= body is serialised with orjson and sent as content=, rather than httpx's json.dumps
+        """
+        if kwargs.get("json") is not None:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": "application/json",
+            }
         kwargs.setdefault("cookies", {})
         kwargs["cookies"] = self._add_auth_cookies(kwargs["cookies"])
-        return self._client.delete(url, **kwargs)
+        return _OrjsonResponse(self._client.request(method, url, **kwargs))
+
+    def cleanup(self, url: str, **kwargs) -> None:
+        """
+        DELETE what a test created, under E2E=1 only.
+        - in-process runs are undone by the db_transaction rollback, so there's nothing to delete
+        - never raises, so a failed cleanup doesn't mask the test's own result
+        """
+        if not E2E:
+            return
+        try:
+            self.delete(url, **kwargs)
+        except Exception:
+            pass
 
     def close(self):
-        self._client.close()
+        if self._close_client:
+            self._client.close()
 
 
 # --------------------------------------------------------------------------------------------------------------------------------
@@ -659,118 +873,445 @@ class AuthenticatedClient:
 # --------------------------------------------------------------------------------------------------------------------------------
 
 
-@pytest.fixture
-def authenticated_user(test_database: str) -> Generator[dict, None, None]:
-    """
-    Create an authenticated test user directly in the database.
-    Returns user data, access token, and refresh token.
-
-    Yields:
-        Dictionary with user data, 'access_token', and 'refresh_token' keys
-    """
-    user_data = _create_test_user_in_db(test_database)
+def _create_authenticated_user(db_name: str) -> dict:
+    """create a test user directly in the database, with an access token and a stored refresh token."""
+    user_data = _create_test_user_in_db(db_name)
     user_id = uuid.UUID(user_data["id"])
     access_token, refresh_token = _create_test_token(user_id)
 
-    _create_test_refresh_token_record(test_database, user_id, refresh_token)
+    _create_test_refresh_token_record(db_name, user_id, refresh_token)
 
-    user_with_tokens = {
+    return {
         **user_data,
         "access_token": access_token,
         "refresh_token": refresh_token,
         "token": access_token,  # Keep for backward compatibility during migration
     }
 
+
+@pytest.fixture(scope="session")
+def session_authenticated_user(test_database: str) -> Generator[dict, None, None]:
+    """
+    session-scoped authenticated test user, created once and shared by every test.
+    - saves an insert, a delete and a JWT sign per test
+    - the access token is signed once, so a session longer than JWT_ACCESS_TOKEN_EXPIRE_MINUTES
+      would see it expire
+
+    Yields:
+        Dictionary with user data, 'access_token', and 'refresh_token' keys
+    """
+    user_with_tokens = _create_authenticated_user(test_database)
+
     yield user_with_tokens
 
     # Cleanup
     try:
-        _delete_test_user_from_db(test_database, user_data["id"])
+        _delete_test_user_from_db(test_database, user_with_tokens["id"])
     except Exception:
         pass
 
 
+@pytest.fixture
+def authenticated_user(session_authenticated_user: dict) -> dict:
+    """
+    the authenticated test user, shared across the session.
+    - use isolated_authenticated_user instead for tests that change the user's own state
+      (e.g. revoking its refresh tokens, deleting it)
+    """
+    return session_authenticated_user
+
+
+@pytest.fixture
+def isolated_authenticated_user(test_database: str) -> Generator[dict, None, None]:
+    """
+    Create a fresh authenticated test user for this test only, deleted afterwards.
+    - when requested, the client fixture authenticates as this user rather than the shared one
+
+    Yields:
+        Dictionary with user data, 'access_token', and 'refresh_token' keys
+    """
+    user_with_tokens = _create_authenticated_user(test_database)
+
+    yield user_with_tokens
+
+    # Cleanup
+    try:
+        _delete_test_user_from_db(test_database, user_with_tokens["id"])
+    except Exception:
+        pass
+
+
+@pytest.fixture(scope="module")
+def bulk_users(test_database: str) -> Generator[list[dict], None, None]:
+    """
+    Create 5 users once per module, directly in the database, for read-only list tests
+    (pagination, sorting) and yield them.
+    - committed, so they outlive each test's db_transaction rollback; deleted after the module
+    - emails start e_..a_, inserted in that order, so a sort by email is observable
+
+    Yields:
+        List of user data dictionaries, in insert order
+    """
+    users = bulk_create_test_users(
+        test_database,
+        [{"email": f"{letter}_{_unique_suffix()}@example.com"} for letter in "edcba"],
+    )
+
+    yield users
+
+    # Cleanup
+    try:
+        _delete_test_users_from_db(test_database, [user["id"] for user in users])
+    except Exception:
+        pass
+
+
+_current_users_by_id: dict[uuid.UUID, UsersModel] = {}
+
+
+async def _get_cached_current_user(
+    request: Request, session: DBSessionDep
+) -> UsersModel:
+    """
+    as get_current_user, but the user row is cached per user id for the rest of the session.
+    - the access token is still verified on every request (signature, expiry), only the
+      user lookup is skipped; a missing/invalid token goes through the real dependency, so is 401
+    - a user's first request goes through the real dependency too (user lookup, 401 if not found)
+    - entries are evicted when a user is deleted (_delete_test_users_from_db), so a deleted
+      user is looked up again, and gets a 401
+    - the cached user is a detached copy, as the looked-up one belongs to that request's session
+    """
+    token = get_access_token_from_cookie(request)
+    user = None
+    if token:
+        try:
+            user_id = uuid.UUID(verify_access_token(token).sub)
+            user = _current_users_by_id.get(user_id)
+        except ValueError:
+            pass  # get_current_user below turns it into a 401
+    if user is None:
+        found = await get_current_user(request, session, None)
+        user = UsersModel(
+            **{
+                attr.key: getattr(found, attr.key)
+                for attr in inspect(UsersModel).column_attrs
+            }
+        )
+        _current_users_by_id[user.id] = user
+    return user
+
+
+@pytest.fixture(scope="session")
+def app_client(test_database: str) -> Generator[TestClient, None, None]:
+    """
+    session-scoped client that calls the app in-process (no server, no sockets).
+    - one for the whole session: the app's lifespan disposes the db engine on exit, and
+      pooled asyncpg connections are tied to the TestClient's event loop
+    - server errors come back as 500s (as from a real server), rather than being raised
+    - get_current_user is overridden for the session, see _get_cached_current_user
+      (E2E=1 runs a real server, so always has the full auth path)
+    """
+    app.dependency_overrides[get_current_user] = _get_cached_current_user
+    try:
+        with TestClient(app, raise_server_exceptions=False) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        _current_users_by_id.clear()
+
+
+@pytest.fixture(scope="session")
+def e2e_http_client(test_database: str) -> Generator[httpx.Client, None, None]:
+    """
+    session-scoped http client for the test API server (E2E=1).
+    - one keep-alive pool for the whole session, rather than a new client + connections per test
+    """
+    timeout = httpx.Timeout(10.0, connect=5.0)
+    with httpx.Client(
+        base_url=TEST_API_BASE_URL,
+        timeout=timeout,
+        follow_redirects=True,
+        limits=_E2E_LIMITS,
+    ) as http_client:
+        yield http_client
+
+
+T = TypeVar("T")
+
+
+def _savepoint_session(conn: AsyncConnection) -> AsyncSession:
+    """session bound to a test's connection, whose commits/rollbacks only touch a savepoint."""
+    return AsyncSession(
+        bind=conn,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+@pytest.fixture
+def db_transaction(app_client: TestClient) -> Generator[AsyncConnection, None, None]:
+    """
+    run everything the app writes during a test in one transaction, rolled back afterwards.
+    - each request's session joins the transaction via a savepoint, so the app's own
+      commits/rollbacks only release/roll back that savepoint
+    - nothing to delete on teardown, the rollback undoes it all
+    """
+    portal = app_client.portal
+    assert portal is not None, "app_client must be entered"
+
+    async def _begin() -> AsyncConnection:
+        conn = await sessionmanager._engine.connect()
+        await conn.begin()
+        return conn
+
+    async def _end(conn: AsyncConnection) -> None:
+        await conn.rollback()
+        await conn.close()
+
+    conn = portal.call(_begin)
+
+    async def _get_test_db_session() -> AsyncIterator[AsyncSession]:
+        # as get_db_session, but bound to the test's connection
+        async with _savepoint_session(conn) as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_db_session] = _get_test_db_session
+    try:
+        yield conn
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+        portal.call(_end, conn)
+
+
+@pytest.fixture
+def run_in_session(
+    request: pytest.FixtureRequest,
+) -> Callable[[Callable[[AsyncSession], Awaitable[T]]], T]:
+    """
+    run an async fn with a session on the test's db_transaction connection, and return its result.
+    - for calling services directly, without the http/routing layer
+    - the session is committed if fn returns (i.e. released to the test's transaction), so the
+      write is still undone by the rollback at the end of the test
+    - e.g. run_in_session(lambda session: UsersService(session).patch(schemas=[...]))
+    - skipped under E2E=1: the fixtures' rows are then committed over http, and their cleanup
+      DELETEs would block on this transaction's row locks
+    """
+    if E2E:
+        pytest.skip("service tests run in-process only")
+    app_client: TestClient = request.getfixturevalue("app_client")
+    conn: AsyncConnection = request.getfixturevalue("db_transaction")
+
+    def _run(fn: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        async def _call() -> T:
+            async with _savepoint_session(conn) as session:
+                result = await fn(session)
+                await session.commit()
+                return result
+
+        return app_client.portal.call(_call)
+
+    return _run
+
+
 @pytest.fixture
 def client(
-    test_database: str, authenticated_user: dict
+    request: pytest.FixtureRequest, test_database: str, authenticated_user: dict
 ) -> Generator[AuthenticatedClient, None, None]:
     """
     function-scoped fixture that provides authenticated http client for testing.
-    Uses the dedicated test API server started by the test_database fixture.
-    Automatically includes auth cookies (access_token and refresh_token) from authenticated_user fixture.
+    Calls the app in-process, or the dedicated test API server started by the test_database fixture when E2E=1.
+    Automatically includes auth cookies (access_token and refresh_token) from authenticated_user fixture,
+    or from isolated_authenticated_user if the test requests it.
     """
-    timeout = httpx.Timeout(10.0, connect=5.0)
+    if "isolated_authenticated_user" in request.fixturenames:
+        authenticated_user = request.getfixturevalue("isolated_authenticated_user")
     access_token = authenticated_user["access_token"]
     refresh_token = authenticated_user["refresh_token"]
 
+    http_client: httpx.Client
+    if E2E:
+        http_client = request.getfixturevalue("e2e_http_client")
+    else:
+        http_client = request.getfixturevalue("app_client")
+        # set up after the authenticated user, so rolled back before the user is deleted
+        request.getfixturevalue("db_transaction")
+    # don't carry cookies set by one test's responses into the next
+    http_client.cookies.clear()
+    # the underlying client is shared across the session, so isn't closed per test
     with AuthenticatedClient(
-        TEST_API_BASE_URL, access_token, refresh_token, timeout
-    ) as http_client:
-        try:
-            response = http_client.get("/health", timeout=5.0)
-            if response.status_code != 200:
-                pytest.fail(
-                    f"Test API server at {TEST_API_BASE_URL} returned status {response.status_code}. "
-                    f"This should not happen - the server should be running from the test_database fixture."
-                )
-        except (httpx.ConnectError, httpx.TimeoutException) as e:
-            pytest.fail(
-                f"Test API server at {TEST_API_BASE_URL} is not reachable. "
-                f"This should not happen - the server should be running from the test_database fixture. "
-                f"Error: {type(e).__name__}"
-            )
-        yield http_client
+        http_client, access_token, refresh_token, close_client=False
+    ) as authenticated_client:
+        yield authenticated_client
 
 
 @pytest.fixture
-def load_test_data():
-    """helper fixture"""
+def db_row_exists(
+    request: pytest.FixtureRequest, client: AuthenticatedClient, test_database: str
+) -> Callable[[type[Base], str], bool]:
+    """
+    helper fixture: check whether a row exists in the db, without a request through the API.
+    - in-process: queried on the test's db_transaction connection, so sees the test's writes
+    - E2E=1: queried on a pooled connection, the API's writes are committed by then
+    """
+    if E2E:
+
+        def _exists_e2e(model: type[Base], id: str) -> bool:
+            table = model.__table__
+            query = pg_sql.SQL("SELECT 1 FROM {} WHERE id = %s").format(
+                pg_sql.Identifier(table.schema, table.name)
+            )
+            with _pg_connection(test_database) as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (str(id),))
+                exists = cursor.fetchone() is not None
+                conn.rollback()
+            return exists
+
+        return _exists_e2e
+
+    app_client: TestClient = request.getfixturevalue("app_client")
+    conn: AsyncConnection = request.getfixturevalue("db_transaction")
+
+    def _exists(model: type[Base], id: str) -> bool:
+        stmt = select(literal(1)).where(model.id == uuid.UUID(str(id))).limit(1)
 
-    def _load_data(file_path: str) -> dict | list:
-        test_data_dir = Path(__file__).resolve().parent / "test_data"
-        full_path = test_data_dir / file_path
+        async def _query() -> bool:
+            result = await conn.execute(stmt)
+            return result.first() is not None
 
-        if not full_path.exists():
-            raise FileNotFoundError(f"Test data file not found: {full_path}")
+        return app_client.portal.call(_query)
+
+    return _exists
+
+
+@functools.lru_cache(maxsize=None)
+def _read_test_data(file_path: str) -> dict | list:
+    """read + parse a test data file, once per session."""
+    full_path = _TESTS_DIR / "test_data" / file_path
+
+    # read_bytes raises for a missing file anyway, so no separate exists() stat
+    try:
+        return orjson.loads(full_path.read_bytes())
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Test data file not found: {full_path}") from e
+
+
+@pytest.fixture(scope="session")
+def load_test_data():
+    """
+    helper fixture
+    - files are parsed once per session; each call gets a deep copy, so tests can modify it
+    - pass immutable=True to get the cached object itself, for tests that only read or send it
+    """
 
-        with open(full_path, "r") as f:
-            return json.load(f)
+    def _load_data(file_path: str, immutable: bool = False) -> dict | list:
+        data = _read_test_data(file_path)
+        return data if immutable else copy.deepcopy(data)
 
     return _load_data
 
 
+def _create_fixture_rows(
+    request: pytest.FixtureRequest,
+    client: AuthenticatedClient,
+    url: str,
+    payloads: list[dict],
+    model: type[Base],
+    schema: type[BaseModel],
+    db_values: list[dict],
+) -> list[dict]:
+    """
+    create a fixture's rows, and return them as the API would, in payload order.
+    - in-process: inserted straight onto the test's db_transaction connection, skipping a request
+      per fixture; the routes themselves are covered by the tests, not the fixtures
+    - E2E=1: POSTed to the API, as there's no shared connection to insert on
+    - either way the rows are json-shaped, so ids are already str and usable in payloads as-is
+
+    Args:
+        payloads: bodies for the POST, also overlaid on the inserted rows (e.g. raw_markdown)
+        db_values: column values to insert, one dict per payload
+    """
+    if E2E:
+        response = client.post(url, json=payloads)
+        response.raise_for_status()
+        return response.json()["data"]
+
+    app_client: TestClient = request.getfixturevalue("app_client")
+    conn: AsyncConnection = request.getfixturevalue("db_transaction")
+    stmt = insert(model).returning(*model.__table__.c, sort_by_parameter_order=True)
+
+    async def _insert() -> list[dict]:
+        result = await conn.execute(stmt, db_values)
+        return [dict(row._mapping) for row in result]
+
+    rows = app_client.portal.call(_insert)
+    return [
+        schema.model_validate({**row, **payload}).model_dump(mode="json")
+        for row, payload in zip(rows, payloads)
+    ]
+
+
+def _create_fixture_row(
+    request: pytest.FixtureRequest,
+    client: AuthenticatedClient,
+    url: str,
+    payload: dict,
+    model: type[Base],
+    schema: type[BaseModel],
+    db_values: dict,
+) -> dict:
+    """single-row _create_fixture_rows."""
+    return _create_fixture_rows(
+        request, client, url, [payload], model, schema, [db_values]
+    )[0]
+
+
 @pytest.fixture
-def test_user(client: AuthenticatedClient) -> Generator[dict, None, None]:
+def test_user(
+    request: pytest.FixtureRequest, client: AuthenticatedClient
+) -> Generator[dict, None, None]:
     """
-    Create a test user via API (requires authenticated client), yield it, and delete it after the test.
+    Create a test user and yield it.
+    - undone by the db_transaction rollback at the end of the test (deleted when E2E=1)
 
     Yields:
         User data dictionary
     """
     user_data = {
-        "email": f"test_{int(time.time())}_{uuid.uuid4().hex[:8]}@example.com",
-        "external_auth_sub": f"test_sub_{int(time.time())}_{uuid.uuid4().hex[:8]}",
+        "email": f"test_{_unique_suffix()}@example.com",
+        "external_auth_sub": f"test_sub_{_unique_suffix()}",
     }
 
-    response = client.post("/api/latest/users", json=[user_data])
-    response.raise_for_status()
-    result = response.json()
-    created_user = result["data"][0]
+    created_user = _create_fixture_row(
+        request,
+        client,
+        "/api/latest/users",
+        user_data,
+        UsersModel,
+        UserSchema,
+        db_values=user_data,
+    )
 
     yield created_user
 
-    try:
-        client.delete("/api/latest/users", params={"ids": [str(created_user["id"])]})
-    except Exception:
-        pass
+    client.cleanup("/api/latest/users", params={"ids": [created_user["id"]]})
 
 
 @pytest.fixture
 def test_thread(
-    client: AuthenticatedClient, authenticated_user: dict
+    request: pytest.FixtureRequest,
+    client: AuthenticatedClient,
+    authenticated_user: dict,
 ) -> Generator[dict, None, None]:
     """
-    Create a test thread, yield it, and delete it after the test.
+    Create a test thread and yield it.
+    - undone by the db_transaction rollback at the end of the test (deleted when E2E=1)
 
     Requires:
         authenticated_user: The authenticated user fixture
@@ -780,32 +1321,32 @@ def test_thread(
     """
     import datetime as dt
 
-    thread_data = {
-        "user_id": str(authenticated_user["id"]),
-        "date": str(dt.date.today()),
-    }
-
-    response = client.post("/api/latest/threads", json=[thread_data])
-    response.raise_for_status()
-    result = response.json()
-    created_thread = result["data"][0]
+    user_id = uuid.UUID(authenticated_user["id"])
+    date = dt.date.today()
+    thread_data = {"user_id": str(user_id), "date": str(date)}
+
+    created_thread = _create_fixture_row(
+        request,
+        client,
+        "/api/latest/threads",
+        thread_data,
+        ThreadsModel,
+        ThreadSchema,
+        db_values={"user_id": user_id, "date": date},
+    )
 
     yield created_thread
 
-    try:
-        client.delete(
-            "/api/latest/threads", params={"ids": [str(created_thread["id"])]}
-        )
-    except Exception:
-        pass
+    client.cleanup("/api/latest/threads", params={"ids": [created_thread["id"]]})
 
 
 @pytest.fixture
 def test_entry(
-    client: AuthenticatedClient, test_thread: dict
+    request: pytest.FixtureRequest, client: AuthenticatedClient, test_thread: dict
 ) -> Generator[dict, None, None]:
     """
-    Create a test entry, yield it, and delete it after the test.
+    Create a test entry and yield it.
+    - undone by the db_transaction rollback at the end of the test (deleted when E2E=1)
 
     Requires:
         test_thread: A thread fixture
@@ -813,30 +1354,80 @@ def test_entry(
     Yields:
         Entry data dictionary
     """
-    entry_data = {
-        "thread_id": str(test_thread["id"]),
-        "raw_markdown": "Test entry content",
-    }
-
-    response = client.post("/api/latest/entries", json=[entry_data])
-    response.raise_for_status()
-    result = response.json()
-    created_entry = result["data"][0]
+    raw_markdown = "Test entry content"
+    entry_data = {"thread_id": test_thread["id"], "raw_markdown": raw_markdown}
+
+    created_entry = _create_fixture_row(
+        request,
+        client,
+        "/api/latest/entries",
+        entry_data,
+        EntriesModel,
+        EntrySchema,
+        db_values={
+            "thread_id": uuid.UUID(test_thread["id"]),
+            "encrypted_markdown": get_encryption_service().encrypt(raw_markdown),
+        },
+    )
 
     yield created_entry
 
-    try:
-        client.delete(f"/api/latest/entries/{created_entry['id']}")
-    except Exception:
-        pass
+    client.cleanup(f"/api/latest/entries/{created_entry['id']}")
+
+
+@pytest.fixture
+def make_test_entries(
+    request: pytest.FixtureRequest, client: AuthenticatedClient, test_thread: dict
+) -> Generator[Callable[[list[str]], list[dict]], None, None]:
+    """
+    factory for entries in test_thread, for tests that need more than the one test_entry.
+    - e.g. make_test_entries([f"Entry {i}" for i in range(20)]), one insert for the batch
+    - undone by the db_transaction rollback at the end of the test (deleted when E2E=1)
+
+    Requires:
+        test_thread: A thread fixture
+
+    Yields:
+        Function taking a list of raw_markdown and returning the created entries, in order
+    """
+    created_ids: list[str] = []
+    encrypt = get_encryption_service().encrypt
+
+    def _make(raw_markdowns: list[str]) -> list[dict]:
+        created = _create_fixture_rows(
+            request,
+            client,
+            "/api/latest/entries",
+            [
+                {"thread_id": test_thread["id"], "raw_markdown": raw_markdown}
+                for raw_markdown in raw_markdowns
+            ],
+            EntriesModel,
+            EntrySchema,
+            db_values=[
+                {
+                    "thread_id": uuid.UUID(test_thread["id"]),
+                    "encrypted_markdown": encrypt(raw_markdown),
+                }
+                for raw_markdown in raw_markdowns
+            ],
+        )
+        created_ids.extend(entry["id"] for entry in created)
+        return created
+
+    yield _make
+
+    if created_ids:
+        client.cleanup("/api/latest/entries", params={"ids": created_ids})
 
 
 @pytest.fixture
 def test_metric(
-    client: AuthenticatedClient, test_thread: dict
+    request: pytest.FixtureRequest, client: AuthenticatedClient, test_thread: dict
 ) -> Generator[dict, None, None]:
     """
-    Create a test metric, yield it, and delete it after the test.
+    Create a test metric and yield it.
+    - undone by the db_transaction rollback at the end of the test (deleted when E2E=1)
 
     Requires:
         test_thread: A thread fixture
@@ -844,23 +1435,18 @@ def test_metric(
     Yields:
         Metric data dictionary
     """
-    metric_data = {
-        "thread_id": str(test_thread["id"]),
-        "sleep_quality": 7,
-        "physical_activity": 3,
-        "overall_mood": 6,
-    }
-
-    response = client.post("/api/latest/metrics", json=[metric_data])
-    response.raise_for_status()
-    result = response.json()
-    created_metric = result["data"][0]
+    scores = {"sleep_quality": 7, "physical_activity": 3, "overall_mood": 6}
+
+    created_metric = _create_fixture_row(
+        request,
+        client,
+        "/api/latest/metrics",
+        {"thread_id": test_thread["id"], **scores},
+        MetricsModel,
+        MetricSchema,
+        db_values={"thread_id": uuid.UUID(test_thread["id"]), **scores},
+    )
 
     yield created_metric
 
-    try:
-        client.delete(
-            "/api/latest/metrics", params={"ids": [str(created_metric["id"])]}
-        )
-    except Exception:
-        pass
+    client.cleanup("/api/latest/metrics", params={"ids": [created_metric["id"]]})
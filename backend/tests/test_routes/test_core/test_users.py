@@ -2,6 +2,7 @@
 
 import httpx
 import pytest
+from api.db.models.core.users import UsersModel
 from tests.conftest import AuthenticatedClient
 
 
@@ -27,7 +28,7 @@ class TestUsersEndpoints:
 
     def test_create_users_valid(self, client: AuthenticatedClient, load_test_data):
         """Test POST /api/latest/users with valid data."""
-        test_data = load_test_data("core/users/valid.json")
+        test_data = load_test_data("core/users/valid.json", immutable=True)
 
         response = client.post("/api/latest/users", json=test_data)
         assert response.status_code == 200
@@ -37,40 +38,36 @@ class TestUsersEndpoints:
         assert len(result["data"]) == 2
 
         created_users = result["data"]
-        for i, user in enumerate(created_users):
+        for user, user_data in zip(created_users, test_data):
             assert "id" in user
-            assert user["email"] == test_data[i]["email"]
-            assert user["external_auth_sub"] == test_data[i]["external_auth_sub"]
+            assert user["email"] == user_data["email"]
+            assert user["external_auth_sub"] == user_data["external_auth_sub"]
             assert "created_at" in user
             assert "updated_at" in user
 
         # Cleanup: delete created users
         user_ids = [user["id"] for user in created_users]
-        client.delete("/api/latest/users", params={"ids": user_ids})
-
-    def test_create_users_invalid_email(
-        self, client: AuthenticatedClient, load_test_data
-    ):
-        """Test POST /api/latest/users with invalid email."""
-        test_data = load_test_data("core/users/invalid_email.json")
-
-        response = client.post("/api/latest/users", json=test_data)
-        assert response.status_code == 422  # Validation error
-
-    def test_create_users_invalid_missing_fields(
-        self, client: AuthenticatedClient, load_test_data
+        client.cleanup("/api/latest/users", params={"ids": user_ids})
+
+    @pytest.mark.parametrize(
+        "data_file",
+        ["core/users/invalid_email.json", "core/users/invalid_missing_fields.json"],
+        ids=["invalid_email", "invalid_missing_fields"],
+    )
+    def test_create_users_invalid(
+        self, client: AuthenticatedClient, load_test_data, data_file: str
     ):
-        """Test POST /api/latest/users with missing required fields."""
-        test_data = load_test_data("core/users/invalid_missing_fields.json")
+        """Test POST /api/latest/users with an invalid body returns 422.
+        - the individual validation cases are in tests/test_schemas
+        """
+        test_data = load_test_data(data_file, immutable=True)
 
         response = client.post("/api/latest/users", json=test_data)
         assert response.status_code == 422  # Validation error
 
     def test_patch_users(self, client: AuthenticatedClient, test_user: dict):
         """Test PATCH /api/latest/users."""
-        patch_data = [
-            {"id": str(test_user["id"]), "external_auth_sub": "updated_auth_sub"}
-        ]
+        patch_data = [{"id": test_user["id"], "external_auth_sub": "updated_auth_sub"}]
 
         response = client.patch("/api/latest/users", json=patch_data)
         assert response.status_code == 200
@@ -78,47 +75,50 @@ class TestUsersEndpoints:
         result = response.json()
         assert "data" in result
         assert len(result["data"]) == 1
-        assert result["data"][0]["external_auth_sub"] == "updated_auth_sub"
-        assert result["data"][0]["id"] == str(test_user["id"])
+        patched_user = result["data"][0]
+        assert patched_user["external_auth_sub"] == "updated_auth_sub"
+        assert patched_user["id"] == test_user["id"]
 
     def test_upsert_users(self, client: AuthenticatedClient):
-        """Test POST /api/latest/users/upsert."""
+        """Test POST /api/latest/users/upsert creates a new user."""
         upsert_data = [
             {"email": "upsert_test@example.com", "external_auth_sub": "upsert_auth_sub"}
         ]
 
         response = client.post("/api/latest/users/upsert", json=upsert_data)
-        print(response.text)
         assert response.status_code == 200
 
         result = response.json()
         assert "data" in result
         assert len(result["data"]) == 1
         created_user = result["data"][0]
+        assert created_user["email"] == "upsert_test@example.com"
+        assert created_user["external_auth_sub"] == "upsert_auth_sub"
 
-        # upsert again with new email but same external_auth_sub (should update based on email, not ID)
-        upsert_data_2 = [
+        # Cleanup
+        client.cleanup("/api/latest/users", params={"ids": [created_user["id"]]})
+
+    def test_upsert_users_existing(self, client: AuthenticatedClient, test_user: dict):
+        """Test POST /api/latest/users/upsert updates the user with the same external_auth_sub."""
+        upsert_data = [
             {
                 "email": "updated_upsert_test@example.com",
-                "external_auth_sub": "upsert_auth_sub",
+                "external_auth_sub": test_user["external_auth_sub"],
             }
         ]
 
-        response2 = client.post("/api/latest/users/upsert", json=upsert_data_2)
-        assert response2.status_code == 200
+        response = client.post("/api/latest/users/upsert", json=upsert_data)
+        assert response.status_code == 200
 
-        result2 = response2.json()
-        assert (
-            result2["data"][0]["external_auth_sub"] == created_user["external_auth_sub"]
-        )
-        assert result2["data"][0]["email"] == "updated_upsert_test@example.com"
+        upserted_user = response.json()["data"][0]
+        assert upserted_user["external_auth_sub"] == test_user["external_auth_sub"]
+        assert upserted_user["email"] == "updated_upsert_test@example.com"
         # Should be the same user (same ID)
-        assert result2["data"][0]["id"] == created_user["id"]
+        assert upserted_user["id"] == test_user["id"]
 
-        # Cleanup
-        client.delete("/api/latest/users", params={"ids": [created_user["id"]]})
-
-    def test_delete_users(self, client: AuthenticatedClient, test_user: dict):
+    def test_delete_users(
+        self, client: AuthenticatedClient, test_user: dict, db_row_exists
+    ):
         """Test DELETE /api/latest/users."""
         user_id = test_user["id"]
 
@@ -126,81 +126,56 @@ class TestUsersEndpoints:
         assert response.status_code == 204
 
         # Verify user is deleted
-        get_response = client.get("/api/latest/users", params={"ids": [str(user_id)]})
-        assert get_response.status_code == 200
-        data = get_response.json()
-        assert len(data["data"]) == 0
+        assert not db_row_exists(UsersModel, user_id)
 
-    def test_get_users_with_pagination(self, client: AuthenticatedClient):
+    @pytest.mark.slow
+    def test_get_users_with_pagination(
+        self, client: AuthenticatedClient, bulk_users: list[dict]
+    ):
         """Test GET /api/latest/users with pagination."""
-        # Create multiple users
-        users_data = [
-            {
-                "email": f"pagination_test_{i}@example.com",
-                "external_auth_sub": f"sub_{i}",
-            }
-            for i in range(5)
-        ]
+        # the two pages are independent, so requested together
+        response, response2 = client.gather(
+            [
+                ("GET", "/api/latest/users", {"params": {"page": 1, "page_size": 2}}),
+                ("GET", "/api/latest/users", {"params": {"page": 2, "page_size": 2}}),
+            ]
+        )
 
-        create_response = client.post("/api/latest/users", json=users_data)
-        assert create_response.status_code == 200
-        created_users = create_response.json()["data"]
-        user_ids = [user["id"] for user in created_users]
+        # Test pagination
+        assert response.status_code == 200
 
-        try:
-            # Test pagination
-            response = client.get(
-                "/api/latest/users", params={"page": 1, "page_size": 2}
-            )
-            assert response.status_code == 200
-
-            data = response.json()
-            assert len(data["data"]) == 2
-            assert data["total_records"] >= 5
-
-            # Test next page
-            response2 = client.get(
-                "/api/latest/users", params={"page": 2, "page_size": 2}
-            )
-            assert response2.status_code == 200
-            data2 = response2.json()
-            assert len(data2["data"]) == 2
-        finally:
-            # Cleanup
-            client.delete("/api/latest/users", params={"ids": user_ids})
-
-    def test_get_users_with_sorting(self, client: AuthenticatedClient):
-        """Test GET /api/latest/users with sorting."""
-        # Create users with different emails
-        users_data = [
-            {"email": "zebra@example.com", "external_auth_sub": "sub_z"},
-            {"email": "apple@example.com", "external_auth_sub": "sub_a"},
-        ]
+        data = response.json()
+        assert len(data["data"]) == 2
+        assert data["total_records"] >= len(bulk_users)
 
-        create_response = client.post("/api/latest/users", json=users_data)
-        assert create_response.status_code == 200
-        created_users = create_response.json()["data"]
-        user_ids = [user["id"] for user in created_users]
+        # Test next page
+        assert response2.status_code == 200
+        data2 = response2.json()
+        assert len(data2["data"]) == 2
+
+    def test_get_users_invalid_sort_direction(self, client: AuthenticatedClient):
+        """Test GET /api/latest/users with a sort_direction other than asc/desc returns 422."""
+        response = client.get(
+            "/api/latest/users", params={"sort_by": "email", "sort_direction": "up"}
+        )
+        assert response.status_code == 422
 
-        try:
-            # Test sorting by email ascending
-            response = client.get(
-                "/api/latest/users", params={"sort_by": "email", "sort_order": "asc"}
-            )
-            assert response.status_code == 200
-
-            data = response.json()
-            if len(data["data"]) >= 2:
-                # Find our created users in the response
-                emails = [
-                    user["email"]
-                    for user in data["data"]
-                    if user["email"] in ["apple@example.com", "zebra@example.com"]
-                ]
-                if "apple@example.com" in emails and "zebra@example.com" in emails:
-                    apple_idx = emails.index("apple@example.com")
-                    zebra_idx = emails.index("zebra@example.com")
-                    assert apple_idx < zebra_idx  # apple comes before zebra
-        finally:
-            # Cleanup
-            client.delete("/api/latest/users", params={"ids": user_ids})
+    def test_get_users_with_sorting(
+        self, client: AuthenticatedClient, bulk_users: list[dict]
+    ):
+        """Test GET /api/latest/users with sorting."""
+        # Test sorting by email ascending
+        response = client.get(
+            "/api/latest/users", params={"sort_by": "email", "sort_order": "asc"}
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        if len(data["data"]) >= 2:
+            # Find the bulk users in the response (inserted in descending email order)
+            bulk_emails = {user["email"] for user in bulk_users}
+            emails = [
+                user["email"] for user in data["data"] if user["email"] in bulk_emails
+            ]
+            if len(emails) == len(bulk_emails):
+                assert emails == sorted(emails)  # a_ comes before ... e_
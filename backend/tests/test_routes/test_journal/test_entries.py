@@ -3,6 +3,8 @@
 import datetime as dt
 import httpx
 import pytest
+from api.db.models.journal.entries import EntriesModel
+from api.db.models.journal.threads import ThreadsModel
 from tests.conftest import AuthenticatedClient
 
 
@@ -24,7 +26,7 @@ class TestEntriesEndpoints:
         """Test POST /api/latest/entries with valid data."""
         entry_data = [
             {
-                "thread_id": str(test_thread["id"]),
+                "thread_id": test_thread["id"],
                 "raw_markdown": "# Test Entry\n\nThis is a test entry.",
             }
         ]
@@ -37,18 +39,59 @@ class TestEntriesEndpoints:
         assert len(result["data"]) == 1
 
         created_entry = result["data"][0]
-        assert created_entry["thread_id"] == str(test_thread["id"])
+        assert created_entry["thread_id"] == test_thread["id"]
         assert created_entry["raw_markdown"] == "# Test Entry\n\nThis is a test entry."
         assert "id" in created_entry
 
         # Cleanup
-        client.delete(f"/api/latest/entries/{created_entry['id']}")
+        client.cleanup(f"/api/latest/entries/{created_entry['id']}")
+
+    def test_create_entries_without_markdown(
+        self, client: AuthenticatedClient, test_thread: dict
+    ):
+        """Test POST /api/latest/entries without raw_markdown returns it as null."""
+        entry_data = [{"thread_id": test_thread["id"]}]
+
+        response = client.post("/api/latest/entries", json=entry_data)
+        assert response.status_code == 200
+
+        created_entry = response.json()["data"][0]
+        try:
+            assert created_entry["raw_markdown"] is None
+
+            get_response = client.get(
+                "/api/latest/entries", params={"ids": [created_entry["id"]]}
+            )
+            assert get_response.status_code == 200
+            assert get_response.json()["data"][0]["raw_markdown"] is None
+        finally:
+            # Cleanup
+            client.cleanup(f"/api/latest/entries/{created_entry['id']}")
+
+    @pytest.mark.slow
+    def test_get_entries_large_page(
+        self, client: AuthenticatedClient, make_test_entries
+    ):
+        """Test GET /api/latest/entries decrypts every entry on a page large enough to be decrypted concurrently."""
+        created_entries = make_test_entries([f"Entry {i}" for i in range(20)])
+        entry_ids = [e["id"] for e in created_entries]
+
+        response = client.get("/api/latest/entries", params={"ids": entry_ids})
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result["total_records"] == 20
+        assert sorted(e["raw_markdown"] for e in result["data"]) == sorted(
+            f"Entry {i}" for i in range(20)
+        )
 
     def test_create_entries_invalid_thread_id(
         self, client: AuthenticatedClient, load_test_data
     ):
         """Test POST /api/latest/entries with non-existent thread_id."""
-        test_data = load_test_data("journal/entries/invalid_thread_id.json")
+        test_data = load_test_data(
+            "journal/entries/invalid_thread_id.json", immutable=True
+        )
 
         response = client.post("/api/latest/entries", json=test_data)
         # Should fail validation or return error
@@ -60,7 +103,7 @@ class TestEntriesEndpoints:
         """Test POST /api/latest/entries with date (creates entry and upserts thread)."""
         entry_date = dt.date.today()
         entry_data = {
-            "user_id": str(authenticated_user["id"]),
+            "user_id": authenticated_user["id"],
             "date": str(entry_date),
             "raw_markdown": "Entry created with date endpoint",
         }
@@ -78,56 +121,47 @@ class TestEntriesEndpoints:
         assert "thread_id" in created_entry
 
         # Cleanup
-        client.delete(f"/api/latest/entries/{created_entry['id']}")
+        client.cleanup(f"/api/latest/entries/{created_entry['id']}")
 
     def test_get_entries_by_date(
-        self, client: AuthenticatedClient, authenticated_user: dict, test_thread: dict
+        self,
+        client: AuthenticatedClient,
+        authenticated_user: dict,
+        test_thread: dict,
+        test_entry: dict,
     ):
         """Test GET /api/latest/entries/date/{date}."""
-        entry_data = {
-            "thread_id": str(test_thread["id"]),
-            "raw_markdown": "Entry for date test",
-        }
-
-        # Create entry
-        create_response = client.post("/api/latest/entries", json=[entry_data])
-        assert create_response.status_code == 200
-        created_entry = create_response.json()["data"][0]
-        entry_id = created_entry["id"]
+        entry_id = test_entry["id"]
 
-        try:
-            # Get entries by date
-            thread_date = test_thread["date"]
-            response = client.get(
-                f"/api/latest/entries/date/{thread_date}",
-                params={"user_id": str(authenticated_user["id"])},
-            )
-            assert response.status_code == 200
+        # Get entries by date
+        thread_date = test_thread["date"]
+        response = client.get(
+            f"/api/latest/entries/date/{thread_date}",
+            params={"user_id": authenticated_user["id"]},
+        )
+        assert response.status_code == 200
 
-            result = response.json()
-            assert "data" in result
-            entries = result["data"]
+        result = response.json()
+        assert "data" in result
+        entries = result["data"]
 
-            # Should find our entry
-            entry_ids = [e["id"] for e in entries]
-            assert entry_id in entry_ids
+        # Should find our entry
+        entry_ids = [e["id"] for e in entries]
+        assert entry_id in entry_ids
 
-            # Verify entry has date field
-            our_entry = next(e for e in entries if e["id"] == entry_id)
-            assert our_entry["date"] == str(thread_date)
-        finally:
-            # Cleanup
-            client.delete(f"/api/latest/entries/{entry_id}")
+        # Verify entry has date field
+        our_entry = {e["id"]: e for e in entries}[entry_id]
+        assert our_entry["date"] == str(thread_date)
 
     def test_delete_entry_with_thread_cleanup(
-        self, client: AuthenticatedClient, authenticated_user: dict
+        self, client: AuthenticatedClient, authenticated_user: dict, db_row_exists
     ):
         """Test DELETE /api/latest/entries/{entry_id} cleans up thread if last entry."""
         entry_date = dt.date.today()
 
         # Create entry (which creates thread)
         entry_data = {
-            "user_id": str(authenticated_user["id"]),
+            "user_id": authenticated_user["id"],
             "date": str(entry_date),
             "raw_markdown": "Only entry in thread",
         }
@@ -145,72 +179,92 @@ class TestEntriesEndpoints:
         assert response.status_code == 204
 
         # Verify thread is also deleted (since it was the last entry)
-        thread_response = client.get("/api/latest/threads", params={"ids": [thread_id]})
-        assert thread_response.status_code == 200
-        thread_data = thread_response.json()
-        assert len(thread_data["data"]) == 0
+        assert not db_row_exists(EntriesModel, entry_id)
+        assert not db_row_exists(ThreadsModel, thread_id)
+
+    def test_delete_entry_keeps_thread_with_other_entries(
+        self,
+        client: AuthenticatedClient,
+        test_thread: dict,
+        make_test_entries,
+        db_row_exists,
+    ):
+        """Test DELETE /api/latest/entries/{entry_id} keeps the thread if other entries remain."""
+        deleted_entry, remaining_entry = make_test_entries(
+            ["First entry", "Second entry"]
+        )
+
+        response = client.delete(f"/api/latest/entries/{deleted_entry['id']}")
+        assert response.status_code == 204
+
+        # Verify only the entry is deleted, the thread + its other entry remain
+        assert not db_row_exists(EntriesModel, deleted_entry["id"])
+        assert db_row_exists(EntriesModel, remaining_entry["id"])
+        assert db_row_exists(ThreadsModel, test_thread["id"])
+
+    def test_delete_entry_with_thread_referenced_by_metric(
+        self,
+        client: AuthenticatedClient,
+        test_thread: dict,
+        test_entry: dict,
+        test_metric: dict,
+        db_row_exists,
+    ):
+        """Test DELETE /api/latest/entries/{entry_id} returns 409 if the thread can't be deleted."""
+        entry_id = test_entry["id"]
 
-    def test_get_calendar(self, client: AuthenticatedClient, authenticated_user: dict):
+        # last entry in the thread, but the thread is still referenced by a metric
+        response = client.delete(f"/api/latest/entries/{entry_id}")
+        assert response.status_code == 409
+
+        # Verify nothing is deleted
+        assert db_row_exists(EntriesModel, entry_id)
+        assert db_row_exists(ThreadsModel, test_thread["id"])
+
+    def test_get_calendar(
+        self, client: AuthenticatedClient, authenticated_user: dict, test_entry: dict
+    ):
         """Test GET /api/latest/entries/calendar."""
+        # test_entry is in today's thread
         start_date = dt.date.today()
         end_date = start_date + dt.timedelta(days=7)
 
-        # Create entry for today
-        entry_data = {
-            "user_id": str(authenticated_user["id"]),
-            "date": str(start_date),
-            "raw_markdown": "Calendar test entry",
-        }
-
-        create_response = client.post(
-            "/api/latest/entries/with-thread", json=entry_data
+        # Get calendar data
+        response = client.get(
+            "/api/latest/entries/calendar",
+            params={
+                "user_id": authenticated_user["id"],
+                "start_date": str(start_date),
+                "end_date": str(end_date),
+            },
         )
-        assert create_response.status_code == 200
-        created_entry = create_response.json()["data"]
-        entry_id = created_entry["id"]
+        assert response.status_code == 200
 
-        try:
-            # Get calendar data
-            response = client.get(
-                "/api/latest/entries/calendar",
-                params={
-                    "user_id": str(authenticated_user["id"]),
-                    "start_date": str(start_date),
-                    "end_date": str(end_date),
-                },
-            )
-            assert response.status_code == 200
+        result = response.json()
+        assert "data" in result
+        calendar_entries = result["data"]
 
-            result = response.json()
-            assert "data" in result
-            calendar_entries = result["data"]
+        # Should have entries for all dates in range
+        assert len(calendar_entries) == 8  # 7 days + 1 (inclusive)
 
-            # Should have entries for all dates in range
-            assert len(calendar_entries) == 8  # 7 days + 1 (inclusive)
+        calendar_by_date = {e["date"]: e for e in calendar_entries}
 
-            # Find today's entry
-            today_entry = next(
-                (e for e in calendar_entries if e["date"] == str(start_date)), None
-            )
-            assert today_entry is not None
-            assert today_entry["hasEntry"] is True
+        # Find today's entry
+        today_entry = calendar_by_date.get(str(start_date))
+        assert today_entry is not None
+        assert today_entry["hasEntry"] is True
 
-            # Find tomorrow's entry (should have no entry)
-            tomorrow = start_date + dt.timedelta(days=1)
-            tomorrow_entry = next(
-                (e for e in calendar_entries if e["date"] == str(tomorrow)), None
-            )
-            assert tomorrow_entry is not None
-            assert tomorrow_entry["hasEntry"] is False
-        finally:
-            # Cleanup
-            client.delete(f"/api/latest/entries/{entry_id}")
+        # Find tomorrow's entry (should have no entry)
+        tomorrow = start_date + dt.timedelta(days=1)
+        tomorrow_entry = calendar_by_date.get(str(tomorrow))
+        assert tomorrow_entry is not None
+        assert tomorrow_entry["hasEntry"] is False
 
     def test_patch_entries(self, client: AuthenticatedClient, test_entry: dict):
         """Test PATCH /api/latest/entries."""
         patch_data = [
             {
-                "id": str(test_entry["id"]),
+                "id": test_entry["id"],
                 "raw_markdown": "Updated markdown content",
             }
         ]
@@ -223,7 +277,9 @@ class TestEntriesEndpoints:
         result = response.json()
         assert result["data"][0]["raw_markdown"] == "Updated markdown content"
 
-    def test_delete_entries(self, client: AuthenticatedClient, test_entry: dict):
+    def test_delete_entries(
+        self, client: AuthenticatedClient, test_entry: dict, db_row_exists
+    ):
         """Test DELETE /api/latest/entries."""
         entry_id = test_entry["id"]
 
@@ -231,9 +287,4 @@ class TestEntriesEndpoints:
         assert response.status_code == 204
 
         # Verify entry is deleted
-        get_response = client.get(
-            "/api/latest/entries", params={"ids": [str(entry_id)]}
-        )
-        assert get_response.status_code == 200
-        data = get_response.json()
-        assert len(data["data"]) == 0
+        assert not db_row_exists(EntriesModel, entry_id)
@@ -2,6 +2,7 @@
 
 import httpx
 import pytest
+from api.db.models.journal.metrics import MetricsModel
 from tests.conftest import AuthenticatedClient
 
 
@@ -23,7 +24,7 @@ class TestMetricsEndpoints:
         """Test POST /api/latest/metrics with valid data."""
         metric_data = [
             {
-                "thread_id": str(test_thread["id"]),
+                "thread_id": test_thread["id"],
                 "sleep_quality": 6,
                 "physical_activity": 6,
                 "overall_mood": 7,
@@ -40,19 +41,21 @@ class TestMetricsEndpoints:
         assert len(result["data"]) == 1
 
         created_metric = result["data"][0]
-        assert created_metric["thread_id"] == str(test_thread["id"])
+        assert created_metric["thread_id"] == test_thread["id"]
         assert created_metric["sleep_quality"] == 6
         assert created_metric["physical_activity"] == 6
         assert "id" in created_metric
 
         # Cleanup
-        client.delete("/api/latest/metrics", params={"ids": [created_metric["id"]]})
+        client.cleanup("/api/latest/metrics", params={"ids": [created_metric["id"]]})
 
     def test_create_metrics_invalid_thread_id(
         self, client: AuthenticatedClient, load_test_data
     ):
         """Test POST /api/latest/metrics with non-existent thread_id."""
-        test_data = load_test_data("journal/metrics/invalid_thread_id.json")
+        test_data = load_test_data(
+            "journal/metrics/invalid_thread_id.json", immutable=True
+        )
 
         response = client.post("/api/latest/metrics", json=test_data)
         # Should fail validation or return error
@@ -64,7 +67,7 @@ class TestMetricsEndpoints:
         """Test POST /api/latest/metrics with additional_metrics JSONB field."""
         metric_data = [
             {
-                "thread_id": str(test_thread["id"]),
+                "thread_id": test_thread["id"],
                 "sleep_quality": 7,
                 "additional_metrics": {
                     "water_intake": 8,
@@ -85,7 +88,7 @@ class TestMetricsEndpoints:
         assert created_metric["additional_metrics"]["steps"] == 10000
 
         # Cleanup
-        client.delete("/api/latest/metrics", params={"ids": [created_metric["id"]]})
+        client.cleanup("/api/latest/metrics", params={"ids": [created_metric["id"]]})
 
     def test_get_metrics_by_ids(self, client: AuthenticatedClient, test_metric: dict):
         """Test GET /api/latest/metrics with specific IDs."""
@@ -100,22 +103,22 @@ class TestMetricsEndpoints:
 
     def test_patch_metrics(self, client: AuthenticatedClient, test_metric: dict):
         """Test PATCH /api/latest/metrics."""
-        patch_data = [
-            {"id": str(test_metric["id"]), "sleep_quality": 5, "overall_mood": 3}
-        ]
+        patch_data = [{"id": test_metric["id"], "sleep_quality": 5, "overall_mood": 3}]
 
         response = client.patch("/api/latest/metrics", json=patch_data)
         assert response.status_code == 200
 
         result = response.json()
-        assert result["data"][0]["sleep_quality"] == 5
-        assert result["data"][0]["overall_mood"] == 3
+        patched_metric = result["data"][0]
+        assert patched_metric["sleep_quality"] == 5
+        assert patched_metric["overall_mood"] == 3
 
+    @pytest.mark.slow
     def test_upsert_metrics(self, client: AuthenticatedClient, test_thread: dict):
         """Test POST /api/latest/metrics/upsert."""
         upsert_data = [
             {
-                "thread_id": str(test_thread["id"]),
+                "thread_id": test_thread["id"],
                 "sleep_quality": 3,
                 "physical_activity": 1,
             }
@@ -131,22 +134,24 @@ class TestMetricsEndpoints:
             # Second upsert with same thread_id (should update based on thread_id, not ID)
             upsert_data_2 = [
                 {
-                    "thread_id": str(test_thread["id"]),
+                    "thread_id": test_thread["id"],
                     "sleep_quality": 5,
                 }
             ]
 
             response2 = client.post("/api/latest/metrics/upsert", json=upsert_data_2)
             assert response2.status_code == 200
-            result2 = response2.json()
-            assert result2["data"][0]["sleep_quality"] == 5
+            upserted_metric = response2.json()["data"][0]
+            assert upserted_metric["sleep_quality"] == 5
             # Should be the same metric (same ID)
-            assert result2["data"][0]["id"] == metric_id
+            assert upserted_metric["id"] == metric_id
         finally:
             # Cleanup
-            client.delete("/api/latest/metrics", params={"ids": [metric_id]})
+            client.cleanup("/api/latest/metrics", params={"ids": [metric_id]})
 
-    def test_delete_metrics(self, client: AuthenticatedClient, test_metric: dict):
+    def test_delete_metrics(
+        self, client: AuthenticatedClient, test_metric: dict, db_row_exists
+    ):
         """Test DELETE /api/latest/metrics."""
         metric_id = test_metric["id"]
 
@@ -156,12 +161,7 @@ class TestMetricsEndpoints:
         assert response.status_code == 204
 
         # Verify metric is deleted
-        get_response = client.get(
-            "/api/latest/metrics", params={"ids": [str(metric_id)]}
-        )
-        assert get_response.status_code == 200
-        data = get_response.json()
-        assert len(data["data"]) == 0
+        assert not db_row_exists(MetricsModel, metric_id)
 
     def test_create_metrics_with_datetime_fields(
         self, client: AuthenticatedClient, test_thread: dict
@@ -171,7 +171,7 @@ class TestMetricsEndpoints:
 
         metric_data = [
             {
-                "thread_id": str(test_thread["id"]),
+                "thread_id": test_thread["id"],
                 "asleep_by": "2024-01-15T22:30:00Z",
                 "awoke_at": "2024-01-16T07:00:00Z",
                 "sleep_quality": 6,
@@ -188,13 +188,14 @@ class TestMetricsEndpoints:
         assert created_metric["awoke_at"] is not None
 
         # Cleanup
-        client.delete("/api/latest/metrics", params={"ids": [created_metric["id"]]})
+        client.cleanup("/api/latest/metrics", params={"ids": [created_metric["id"]]})
 
+    @pytest.mark.slow
     def test_metrics_unique_constraint(
         self, client: AuthenticatedClient, test_thread: dict
     ):
         """Test that metrics have unique constraint on thread_id."""
-        metric_data = [{"thread_id": str(test_thread["id"]), "sleep_quality": 6}]
+        metric_data = [{"thread_id": test_thread["id"], "sleep_quality": 6}]
 
         # Create first metric
         response1 = client.post("/api/latest/metrics", json=metric_data)
@@ -209,4 +210,4 @@ class TestMetricsEndpoints:
             assert response2.status_code in [400, 409, 422]
         finally:
             # Cleanup
-            client.delete("/api/latest/metrics", params={"ids": [metric_id]})
+            client.cleanup("/api/latest/metrics", params={"ids": [metric_id]})
@@ -3,7 +3,9 @@
 import datetime as dt
 import httpx
 import pytest
-from tests.conftest import AuthenticatedClient
+from api.db.models.journal.threads import ThreadsModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.conftest import E2E, AuthenticatedClient
 
 
 class TestThreadsEndpoints:
@@ -25,7 +27,7 @@ class TestThreadsEndpoints:
     ):
         """Test thread creation with valid user."""
         thread_data = [
-            {"user_id": str(authenticated_user["id"]), "date": str(dt.date.today())}
+            {"user_id": authenticated_user["id"], "date": str(dt.date.today())}
         ]
 
         response = client.post("/api/latest/threads", json=thread_data)
@@ -36,32 +38,33 @@ class TestThreadsEndpoints:
         assert len(result["data"]) == 1
 
         created_thread = result["data"][0]
-        assert created_thread["user_id"] == str(authenticated_user["id"])
+        assert created_thread["user_id"] == authenticated_user["id"]
         assert created_thread["date"] == str(dt.date.today())
         assert "id" in created_thread
         assert "created_at" in created_thread
 
         # Cleanup
-        client.delete("/api/latest/threads", params={"ids": [created_thread["id"]]})
+        client.cleanup("/api/latest/threads", params={"ids": [created_thread["id"]]})
 
     def test_create_thread_invalid_user_id(
         self, client: AuthenticatedClient, load_test_data
     ):
         """Test thread creation with non-existent user_id."""
-        test_data = load_test_data("journal/threads/invalid_user_id.json")
+        test_data = load_test_data(
+            "journal/threads/invalid_user_id.json", immutable=True
+        )
 
         response = client.post("/api/latest/threads", json=test_data)
         # Should fail validation or return error (403 if user_id doesn't match authenticated user, 404 if user doesn't exist)
         assert response.status_code in [400, 403, 404, 422]
 
+    @pytest.mark.slow
     def test_create_thread_duplicate_date(
         self, client: AuthenticatedClient, authenticated_user: dict
     ):
         """Test that creating threads with duplicate user_id+date fails."""
         thread_date = dt.date.today()
-        thread_data = [
-            {"user_id": str(authenticated_user["id"]), "date": str(thread_date)}
-        ]
+        thread_data = [{"user_id": authenticated_user["id"], "date": str(thread_date)}]
 
         # Create first thread
         response1 = client.post("/api/latest/threads", json=thread_data)
@@ -76,7 +79,7 @@ class TestThreadsEndpoints:
             assert response2.status_code in [400, 409, 422]
         finally:
             # Cleanup
-            client.delete("/api/latest/threads", params={"ids": [thread_id]})
+            client.cleanup("/api/latest/threads", params={"ids": [thread_id]})
 
     def test_get_threads_by_ids(self, client: AuthenticatedClient, test_thread: dict):
         """Test GET /api/latest/threads with specific IDs."""
@@ -92,7 +95,7 @@ class TestThreadsEndpoints:
     def test_patch_threads(self, client: AuthenticatedClient, test_thread: dict):
         """Test PATCH /api/latest/threads."""
         new_date = dt.date.today() + dt.timedelta(days=1)
-        patch_data = [{"id": str(test_thread["id"]), "date": str(new_date)}]
+        patch_data = [{"id": test_thread["id"], "date": str(new_date)}]
 
         response = client.patch("/api/latest/threads", json=patch_data)
         assert response.status_code == 200
@@ -103,28 +106,65 @@ class TestThreadsEndpoints:
     def test_upsert_threads(
         self, client: AuthenticatedClient, authenticated_user: dict
     ):
-        """Test POST /api/latest/threads/upsert."""
+        """Test POST /api/latest/threads/upsert creates a new thread."""
         thread_date = dt.date.today() + dt.timedelta(days=2)
-        upsert_data = [
-            {"user_id": str(authenticated_user["id"]), "date": str(thread_date)}
+        upsert_data = [{"user_id": authenticated_user["id"], "date": str(thread_date)}]
+
+        response = client.post("/api/latest/threads/upsert", json=upsert_data)
+        assert response.status_code == 200
+        created_thread = response.json()["data"][0]
+        assert created_thread["user_id"] == authenticated_user["id"]
+        assert created_thread["date"] == str(thread_date)
+
+        # Cleanup
+        client.cleanup("/api/latest/threads", params={"ids": [created_thread["id"]]})
+
+    def test_upsert_threads_existing(
+        self, client: AuthenticatedClient, test_thread: dict
+    ):
+        """Test POST /api/latest/threads/upsert returns the existing thread for the same user+date."""
+        upsert_data = [{"user_id": test_thread["user_id"], "date": test_thread["date"]}]
+
+        response = client.post("/api/latest/threads/upsert", json=upsert_data)
+        assert response.status_code == 200
+        assert response.json()["data"][0]["id"] == test_thread["id"]
+
+    def test_create_threads_without_echo(
+        self, client: AuthenticatedClient, authenticated_user: dict, db_row_exists
+    ):
+        """Test POST /api/latest/threads?echo=false returns only ids."""
+        thread_data = [
+            {"user_id": authenticated_user["id"], "date": str(dt.date.today())}
         ]
 
-        # First upsert (create)
-        response1 = client.post("/api/latest/threads/upsert", json=upsert_data)
-        assert response1.status_code == 200
-        created_thread = response1.json()["data"][0]
-        thread_id = created_thread["id"]
+        response = client.post(
+            "/api/latest/threads", json=thread_data, params={"echo": False}
+        )
+        assert response.status_code == 200
 
-        try:
-            # Second upsert with same data (should return existing)
-            response2 = client.post("/api/latest/threads/upsert", json=upsert_data)
-            assert response2.status_code == 200
-            assert response2.json()["data"][0]["id"] == thread_id
-        finally:
-            # Cleanup
-            client.delete("/api/latest/threads", params={"ids": [thread_id]})
+        result = response.json()
+        assert list(result) == ["ids"]
+        assert len(result["ids"]) == 1
+        assert db_row_exists(ThreadsModel, result["ids"][0])
 
-    def test_delete_threads(self, client: AuthenticatedClient, test_thread: dict):
+        # Cleanup
+        client.cleanup("/api/latest/threads", params={"ids": result["ids"]})
+
+    def test_upsert_threads_without_echo(
+        self, client: AuthenticatedClient, test_thread: dict
+    ):
+        """Test POST /api/latest/threads/upsert?echo=false returns only ids."""
+        upsert_data = [{"user_id": test_thread["user_id"], "date": test_thread["date"]}]
+
+        response = client.post(
+            "/api/latest/threads/upsert", json=upsert_data, params={"echo": False}
+        )
+        assert response.status_code == 200
+        assert response.json() == {"ids": [test_thread["id"]]}
+
+    def test_delete_threads(
+        self, client: AuthenticatedClient, test_thread: dict, db_row_exists
+    ):
         """Test DELETE /api/latest/threads."""
         thread_id = test_thread["id"]
 
@@ -134,9 +174,47 @@ class TestThreadsEndpoints:
         assert response.status_code == 204
 
         # Verify thread is deleted
-        get_response = client.get(
-            "/api/latest/threads", params={"ids": [str(thread_id)]}
-        )
+        assert not db_row_exists(ThreadsModel, thread_id)
+
+    def test_create_thread_visible_to_next_request(
+        self, client: AuthenticatedClient, authenticated_user: dict
+    ):
+        """Test a thread is committed by the time POST /api/latest/threads responds."""
+        thread_data = [
+            {"user_id": authenticated_user["id"], "date": str(dt.date.today())}
+        ]
+
+        response = client.post("/api/latest/threads", json=thread_data)
+        assert response.status_code == 200
+        thread_id = response.json()["data"][0]["id"]
+
+        get_response = client.get("/api/latest/threads", params={"ids": [thread_id]})
         assert get_response.status_code == 200
-        data = get_response.json()
-        assert len(data["data"]) == 0
+        assert [t["id"] for t in get_response.json()["data"]] == [thread_id]
+
+        # Cleanup
+        client.cleanup("/api/latest/threads", params={"ids": [thread_id]})
+
+    def test_delete_threads_commit_failure(
+        self,
+        client: AuthenticatedClient,
+        test_thread: dict,
+        db_row_exists,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test a failed commit returns a 500, not a 2xx, and the delete is rolled back."""
+        if E2E:
+            pytest.skip("patches the session in-process")
+
+        async def _failing_commit(self: AsyncSession) -> None:
+            raise RuntimeError("commit failed")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(AsyncSession, "commit", _failing_commit)
+            response = client.delete(
+                "/api/latest/threads", params={"ids": [test_thread["id"]]}
+            )
+        assert response.status_code == 500
+
+        # Verify thread is not deleted
+        assert db_row_exists(ThreadsModel, test_thread["id"])
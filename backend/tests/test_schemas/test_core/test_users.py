@@ -0,0 +1,31 @@
+"""Tests for the users request schemas, validated directly with no request or db."""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from api.api_schemas.core.users import UserCreateSchema
+
+# as the POST /api/latest/users body
+_create_body = TypeAdapter(list[UserCreateSchema])
+
+
+class TestUserSchemas:
+    """Tests for UserCreateSchema."""
+
+    def test_create_valid(self, load_test_data):
+        """Test the valid POST body validates."""
+        test_data = load_test_data("core/users/valid.json", immutable=True)
+
+        users = _create_body.validate_python(test_data)
+        assert [user.email for user in users] == [u["email"] for u in test_data]
+
+    @pytest.mark.parametrize(
+        "data_file",
+        ["core/users/invalid_email.json", "core/users/invalid_missing_fields.json"],
+        ids=["invalid_email", "invalid_missing_fields"],
+    )
+    def test_create_invalid(self, load_test_data, data_file: str):
+        """Test an invalid email / missing required fields is rejected."""
+        test_data = load_test_data(data_file, immutable=True)
+
+        with pytest.raises(ValidationError):
+            _create_body.validate_python(test_data)
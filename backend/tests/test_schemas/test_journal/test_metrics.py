@@ -0,0 +1,35 @@
+"""Tests for the metrics request schemas, validated directly with no request or db."""
+
+import uuid
+import pytest
+from pydantic import ValidationError
+from api.api_schemas.journal.metrics import MetricCreateSchema, MetricPatchSchema
+
+
+class TestMetricSchemas:
+    """Tests for MetricCreateSchema / MetricPatchSchema."""
+
+    @pytest.mark.parametrize("score", [1, 7])
+    def test_scores_in_range(self, score: int):
+        """Test scores at either end of the 1-7 range validate."""
+        metric = MetricCreateSchema(thread_id=uuid.uuid4(), sleep_quality=score)
+        assert metric.sleep_quality == score
+
+    @pytest.mark.parametrize(
+        "schema", [MetricCreateSchema, MetricPatchSchema], ids=["create", "patch"]
+    )
+    @pytest.mark.parametrize(
+        "field", ["sleep_quality", "physical_activity", "overall_mood"]
+    )
+    @pytest.mark.parametrize("score", [0, 8])
+    def test_scores_out_of_range(self, schema, field: str, score: int):
+        """Test scores outside 1-7 are rejected."""
+        ids = {"id": uuid.uuid4()} if schema is MetricPatchSchema else {}
+
+        with pytest.raises(ValidationError):
+            schema(thread_id=uuid.uuid4(), **ids, **{field: score})
+
+    def test_patch_requires_id(self):
+        """Test a patch without an id is rejected."""
+        with pytest.raises(ValidationError):
+            MetricPatchSchema(sleep_quality=5)
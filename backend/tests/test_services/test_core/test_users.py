@@ -0,0 +1,24 @@
+"""Tests for UsersService, called directly rather than through /api/latest/users."""
+
+import uuid
+from api.api_schemas.core.users import UserPatchSchema
+from api.services.core.users import UsersService
+
+
+class TestUsersService:
+    """Tests for UsersService."""
+
+    def test_patch_users(self, run_in_session, test_user: dict):
+        """Test UsersService.patch updates the row."""
+        schemas = [
+            UserPatchSchema(
+                id=uuid.UUID(test_user["id"]), external_auth_sub="updated_auth_sub"
+            )
+        ]
+
+        patched = run_in_session(lambda session: UsersService(session).patch(schemas))
+
+        assert len(patched) == 1
+        assert str(patched[0].id) == test_user["id"]
+        assert patched[0].external_auth_sub == "updated_auth_sub"
+        assert patched[0].email == test_user["email"]
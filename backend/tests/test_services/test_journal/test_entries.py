@@ -0,0 +1,36 @@
+"""Tests for EntriesService, called directly rather than through /api/latest/entries."""
+
+import uuid
+from api.api_schemas.journal.entries import EntryPatchSchema
+from api.services.journal.entries import EntriesService
+from api.utils.encryption import get_encryption_service
+
+
+class TestEntriesService:
+    """Tests for EntriesService."""
+
+    def test_patch_with_encryption(self, run_in_session, test_entry: dict):
+        """Test EntriesService.patch_with_encryption stores encrypted and returns decrypted markdown."""
+        schemas = [
+            EntryPatchSchema(
+                id=uuid.UUID(test_entry["id"]), raw_markdown="Updated markdown content"
+            )
+        ]
+
+        async def _patch_and_reload(session):
+            service = EntriesService(session)
+            patched = await service.patch_with_encryption(schemas)
+            stored = await service.get_one_or_none_by_id(patched[0].id)
+            return patched, stored
+
+        patched, stored = run_in_session(_patch_and_reload)
+
+        assert len(patched) == 1
+        assert str(patched[0].id) == test_entry["id"]
+        assert patched[0].raw_markdown == "Updated markdown content"
+        # stored encrypted, not as plaintext
+        assert stored.encrypted_markdown != "Updated markdown content"
+        assert (
+            get_encryption_service().decrypt(stored.encrypted_markdown)
+            == "Updated markdown content"
+        )
@@ -0,0 +1,26 @@
+"""Tests for MetricsService, called directly rather than through /api/latest/metrics."""
+
+import uuid
+from api.api_schemas.journal.metrics import MetricPatchSchema
+from api.services.journal.metrics import MetricsService
+
+
+class TestMetricsService:
+    """Tests for MetricsService."""
+
+    def test_patch_metrics(self, run_in_session, test_metric: dict):
+        """Test MetricsService.patch updates only the given fields."""
+        schemas = [
+            MetricPatchSchema(
+                id=uuid.UUID(test_metric["id"]), sleep_quality=5, overall_mood=3
+            )
+        ]
+
+        patched = run_in_session(lambda session: MetricsService(session).patch(schemas))
+
+        assert len(patched) == 1
+        assert str(patched[0].id) == test_metric["id"]
+        assert patched[0].sleep_quality == 5
+        assert patched[0].overall_mood == 3
+        # unset fields are left as they were
+        assert patched[0].physical_activity == test_metric["physical_activity"]
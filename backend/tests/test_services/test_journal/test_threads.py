@@ -0,0 +1,21 @@
+"""Tests for ThreadsService, called directly rather than through /api/latest/threads."""
+
+import datetime as dt
+import uuid
+from api.api_schemas.journal.threads import ThreadPatchSchema
+from api.services.journal.threads import ThreadsService
+
+
+class TestThreadsService:
+    """Tests for ThreadsService."""
+
+    def test_patch_threads(self, run_in_session, test_thread: dict):
+        """Test ThreadsService.patch updates the row."""
+        new_date = dt.date.today() + dt.timedelta(days=1)
+        schemas = [ThreadPatchSchema(id=uuid.UUID(test_thread["id"]), date=new_date)]
+
+        patched = run_in_session(lambda session: ThreadsService(session).patch(schemas))
+
+        assert len(patched) == 1
+        assert str(patched[0].id) == test_thread["id"]
+        assert patched[0].date == new_date
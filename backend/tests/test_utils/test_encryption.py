@@ -0,0 +1,114 @@
+"""Tests for the encryption service, AES-256-GCM tokens and legacy Fernet tokens."""
+
+import asyncio
+import base64
+import pytest
+from cryptography.fernet import Fernet
+from api.utils.encryption import (
+    _AESGCM_VERSION,
+    _PARALLEL_THRESHOLD,
+    EncryptionService,
+    _is_fernet_token,
+)
+
+KEY = Fernet.generate_key()
+PLAINTEXT = "# Today\n\nWent for a walk, ünïcödé too."
+
+
+@pytest.fixture(scope="module")
+def service() -> EncryptionService:
+    return EncryptionService.from_key(KEY.decode())
+
+
+def _tamper(token: str, index: int) -> str:
+    """flip the low bit of one byte of the decoded token, and re-encode."""
+    raw = bytearray(base64.urlsafe_b64decode(token))
+    raw[index] ^= 0x01
+    return base64.urlsafe_b64encode(bytes(raw)).decode("ascii")
+
+
+class TestEncryptionService:
+    """Tests for EncryptionService."""
+
+    def test_decrypt_legacy_fernet_token(self, service: EncryptionService):
+        """Test a value written by the Fernet-only code still decrypts."""
+        token = Fernet(KEY).encrypt(PLAINTEXT.encode("utf-8")).decode("ascii")
+
+        assert service.decrypt(token) == PLAINTEXT
+
+    def test_aesgcm_round_trip(self, service: EncryptionService):
+        """Test a value encrypts to an AES-GCM token and decrypts back."""
+        token = service.encrypt(PLAINTEXT)
+
+        assert base64.urlsafe_b64decode(token)[:1] == _AESGCM_VERSION
+        assert service.decrypt(token) == PLAINTEXT
+
+    def test_aesgcm_tokens_use_a_fresh_nonce(self, service: EncryptionService):
+        """Test the same plaintext encrypts to a different token each time."""
+        assert service.encrypt(PLAINTEXT) != service.encrypt(PLAINTEXT)
+
+    def test_is_fernet_token(self, service: EncryptionService):
+        """Test the two token formats are told apart."""
+        fernet_token = Fernet(KEY).encrypt(PLAINTEXT.encode("utf-8"))
+        aesgcm_token = service.encrypt_bytes(PLAINTEXT.encode("utf-8"))
+
+        assert _is_fernet_token(fernet_token)
+        assert not _is_fernet_token(aesgcm_token)
+
+    @pytest.mark.parametrize("index", [0, -1], ids=["version_byte", "tag"])
+    def test_decrypt_tampered_aesgcm_token(
+        self, service: EncryptionService, index: int
+    ):
+        """Test a token with a modified version byte or tag is rejected."""
+        token = _tamper(service.encrypt(PLAINTEXT), index)
+
+        with pytest.raises(ValueError):
+            service.decrypt(token)
+
+    def test_decrypt_tampered_fernet_token(self, service: EncryptionService):
+        """Test a legacy token with a modified HMAC is rejected."""
+        token = Fernet(KEY).encrypt(PLAINTEXT.encode("utf-8")).decode("ascii")
+
+        with pytest.raises(ValueError):
+            service.decrypt(_tamper(token, -1))
+
+    def test_decrypt_with_another_key(self, service: EncryptionService):
+        """Test a token from another key is rejected."""
+        other = EncryptionService.from_key(Fernet.generate_key().decode())
+
+        with pytest.raises(ValueError):
+            service.decrypt(other.encrypt(PLAINTEXT))
+
+    def test_encrypt_decrypt_none(self, service: EncryptionService):
+        """Test None passes through encrypt/decrypt."""
+        assert service.encrypt(None) is None
+        assert service.decrypt(None) is None
+
+    def test_many_preserves_order_and_none(self, service: EncryptionService):
+        """Test encrypt_many/decrypt_many keep order and None values."""
+        plaintexts = ["first", None, "third", None]
+
+        ciphertexts = service.encrypt_many(plaintexts)
+
+        assert [ct is None for ct in ciphertexts] == [False, True, False, True]
+        assert service.decrypt_many(ciphertexts) == plaintexts
+
+    @pytest.mark.parametrize(
+        "size",
+        [_PARALLEL_THRESHOLD, _PARALLEL_THRESHOLD * 4 + 1],
+        ids=["inline", "chunked"],
+    )
+    def test_many_async_preserves_order_and_none(
+        self, service: EncryptionService, size: int
+    ):
+        """Test the _async variants keep order and None values, inline or split into chunks."""
+        plaintexts = [None if i % 3 == 0 else f"Entry {i}" for i in range(size)]
+
+        async def _round_trip() -> list:
+            ciphertexts = await service.encrypt_many_async(plaintexts)
+            assert [ct is None for ct in ciphertexts] == [
+                pt is None for pt in plaintexts
+            ]
+            return await service.decrypt_many_async(ciphertexts)
+
+        assert asyncio.run(_round_trip()) == plaintexts